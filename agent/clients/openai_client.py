@@ -7,6 +7,8 @@ Example:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import keyring
 import openai
 from openai import OpenAI
@@ -39,33 +41,56 @@ def translate_openai_error(exc: Exception) -> ExternalServiceError:
 
 
 def get_openai_client() -> OpenAI:
-    """Return an authenticated OpenAI client using keyring or env credentials."""
-    if settings.OPENAI_USE_KEYCHAIN:
+    """Return an authenticated OpenAI client using keyring or env credentials.
+
+    Credentials are resolved and the client is built once per distinct
+    credential configuration; later calls reuse it along with its HTTP
+    connection pool. Failures are not cached.
+    """
+    return _build_openai_client(
+        use_keychain=settings.OPENAI_USE_KEYCHAIN,
+        keychain_service=settings.OPENAI_KEYCHAIN_SERVICE,
+        keychain_label=settings.OPENAI_KEYCHAIN_LABEL,
+        env_api_key=settings.OPENAI_API_KEY,
+        ssm_parameter_name=settings.OPENAI_API_KEY_SSM_PARAMETER,
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_openai_client(
+    *,
+    use_keychain: bool,
+    keychain_service: str,
+    keychain_label: str,
+    env_api_key: str | None,
+    ssm_parameter_name: str | None,
+) -> OpenAI:
+    if use_keychain:
         api_key = keyring.get_password(
-            settings.OPENAI_KEYCHAIN_SERVICE,
-            settings.OPENAI_KEYCHAIN_LABEL,
+            keychain_service,
+            keychain_label,
         )
         if not api_key:
             logger.error(
                 "openai_client.missing_credentials",
                 fix=(
                     "Run: keyring set "
-                    f"{settings.OPENAI_KEYCHAIN_SERVICE} "
-                    f"{settings.OPENAI_KEYCHAIN_LABEL} <your-api-key>"
+                    f"{keychain_service} "
+                    f"{keychain_label} <your-api-key>"
                 ),
             )
             raise AuthError(
                 "Missing OpenAI API key in keychain "
-                f"(service='{settings.OPENAI_KEYCHAIN_SERVICE}', "
-                f"label='{settings.OPENAI_KEYCHAIN_LABEL}'). "
+                f"(service='{keychain_service}', "
+                f"label='{keychain_label}'). "
                 "Fix: keyring set "
-                f"{settings.OPENAI_KEYCHAIN_SERVICE} "
-                f"{settings.OPENAI_KEYCHAIN_LABEL} <your-api-key>"
+                f"{keychain_service} "
+                f"{keychain_label} <your-api-key>"
             )
     else:
         api_key = resolve_env_or_ssm_secret(
-            current_value=settings.OPENAI_API_KEY,
-            ssm_parameter_name=settings.OPENAI_API_KEY_SSM_PARAMETER,
+            current_value=env_api_key,
+            ssm_parameter_name=ssm_parameter_name,
             secret_name="OPENAI_API_KEY",
         )
         if not api_key:
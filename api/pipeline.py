@@ -24,12 +24,7 @@ from services.synthesizer.llm_execution.prompt_builder import build_messages
 from services.synthesizer.llm_execution.types import PromptMessage
 from api.models import ClientThread, EvidenceResponse, SearchPlan
 from services.synthesizer.models import EvidenceRequest, EvidenceResult, PostPayload
-from services.synthesizer.stage_summary import (
-    build_stage_diagnostics,
-    summarize_evidence_result,
-    summarize_fetch_result,
-    summarize_llm_context,
-)
+from services.synthesizer.stage_summary import build_all_summaries
 from services.synthesizer.context_builder import build_context_request
 from services.context_builder.config import ContextBuilderConfig
 
@@ -201,14 +196,12 @@ async def pipeline_stage_summary(
 ) -> dict[str, Any]:
     """Run the evidence pipeline and return stage-boundary summaries only."""
     plan, fetch_result, request, result = await _run_pipeline(query, config_path)
-    fetch_result_summary = summarize_fetch_result(fetch_result)
-    llm_context_summary = summarize_llm_context(request)
-    evidence_result_summary = summarize_evidence_result(result)
-    diagnostics = build_stage_diagnostics(
+    (
         fetch_result_summary,
         llm_context_summary,
         evidence_result_summary,
-    )
+        diagnostics,
+    ) = build_all_summaries(fetch_result, request, result)
 
     return {
         "search_plan": {
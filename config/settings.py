@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -122,6 +124,28 @@ class Settings(BaseSettings):
         validation_alias="REDDIT_KEYCHAIN_LABEL",
         description="Keychain label for Reddit credentials",
     )
+    REDDIT_MAX_CONCURRENT_REQUESTS: int = Field(
+        8,
+        ge=1,
+        validation_alias="REDDIT_MAX_CONCURRENT_REQUESTS",
+        description="Max Reddit API requests in flight at once per session",
+    )
+    REDDIT_HTTP2: bool = Field(
+        False,
+        validation_alias="REDDIT_HTTP2",
+        description="Multiplex Reddit API requests over HTTP/2 (requires the httpx[http2] extra)",
+    )
+    REDDIT_RESPONSE_CACHE_PATH: str | None = Field(
+        None,
+        validation_alias="REDDIT_RESPONSE_CACHE_PATH",
+        description="SQLite file caching successful Reddit GET responses across runs (dev only; unset disables)",
+    )
+    REDDIT_RESPONSE_CACHE_TTL_SECONDS: int = Field(
+        3600,
+        ge=0,
+        validation_alias="REDDIT_RESPONSE_CACHE_TTL_SECONDS",
+        description="How long cached Reddit responses stay fresh",
+    )
 
     # Internal Proxy Authentication
     PROXY_TOKEN: str | None = Field(
@@ -180,6 +204,12 @@ class Settings(BaseSettings):
             "how many comment excerpts are included in the LLM payload."
         ),
     )
+    FETCHER_CPU_WORKERS: int = Field(
+        0,
+        ge=0,
+        validation_alias="FETCHER_CPU_WORKERS",
+        description="Worker processes for comment cleaning/filtering; 0 runs it inline on the event loop",
+    )
 
     # Semantic Ranking Configuration
     USE_SEMANTIC_RANKING: bool = Field(
@@ -202,6 +232,11 @@ class Settings(BaseSettings):
         validation_alias="MAX_EMBED_TEXT_CHARS",
         description="Max characters for embedding input text",
     )
+    EMBEDDING_CACHE_QUANT: Literal["none", "scalar"] = Field(
+        "none",
+        validation_alias="EMBEDDING_CACHE_QUANT",
+        description="Embedding cache storage: none (float32) or scalar (int8, ~4x smaller)",
+    )
     VECTOR_STORE_TYPE: str = Field(
         "sqlite",
         validation_alias="VECTOR_STORE_TYPE",
@@ -0,0 +1,113 @@
+"""Shared writer for run-script JSON artifacts.
+
+Usage:
+    from scripts.runs.artifact_io import write_json_artifact
+
+    path = write_json_artifact(output_dir / "fetch_preview_20260101_120000.json", payload)
+    path = write_json_artifact(output_path, payload, pretty=True)
+    path = write_json_artifact(output_path, payload, skip_unchanged=True)
+    path = write_json_artifact(output_path, payload, skip_unchanged=True, digest_payload=stable_part)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_GZIP_SUFFIX = ".gz"
+_GZIP_COMPRESSLEVEL = 3
+LATEST_DIGEST_FILENAME = "latest.sha"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file, then rename it over `path`.
+
+    Readers never observe a partially written artifact, even if the run dies
+    mid-write.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def encode_json(payload: Any, *, pretty: bool = False) -> bytes:
+    """Encode a JSON-compatible payload to UTF-8 bytes (compact unless pretty)."""
+    return to_json(payload, indent=2 if pretty else None)
+
+
+def _payload_digest(encoded: bytes) -> str:
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _previous_artifact(digest_path: Path, digest: str) -> Path | None:
+    """Return the last artifact written in this directory if its digest matches."""
+    if not digest_path.exists():
+        return None
+    previous_digest, _, previous_name = digest_path.read_text(encoding="utf-8").partition(" ")
+    previous_path = digest_path.parent / previous_name.strip()
+    if previous_digest != digest or not previous_name.strip() or not previous_path.exists():
+        return None
+    return previous_path
+
+
+def write_json_artifact(
+    path: Path,
+    payload: Any,
+    *,
+    pretty: bool = False,
+    skip_unchanged: bool = False,
+    digest_payload: Any = None,
+) -> Path:
+    """Write payload as JSON and return the path actually written.
+
+    Compact output is gzip-compressed to `<path>.gz`; pretty output is written
+    as plain indented JSON to `path` for manual inspection.
+
+    With `skip_unchanged`, a digest of the encoded payload is kept in
+    `latest.sha` next to the artifact; when the payload matches the previous
+    run, nothing is written and the previous artifact's path is returned.
+    Pass `digest_payload` to hash something other than `payload`, e.g. the
+    payload without per-run ids, or with the output label mixed in.
+    """
+    encoded = encode_json(payload, pretty=pretty)
+    digest_path = path.parent / LATEST_DIGEST_FILENAME
+    digest: str | None = None
+    if skip_unchanged:
+        digest = _payload_digest(
+            encoded if digest_payload is None else encode_json(digest_payload, pretty=pretty)
+        )
+        previous_path = _previous_artifact(digest_path, digest)
+        if previous_path is not None:
+            logger.info("Payload unchanged since %s; skipping write", previous_path)
+            return previous_path
+
+    if pretty:
+        written_path = path
+        atomic_write_bytes(written_path, encoded)
+    else:
+        written_path = path.with_name(path.name + _GZIP_SUFFIX)
+        atomic_write_bytes(written_path, gzip.compress(encoded, compresslevel=_GZIP_COMPRESSLEVEL))
+
+    if digest is not None:
+        atomic_write_bytes(digest_path, f"{digest} {written_path.name}\n".encode())
+    return written_path
+
+
+def read_json_artifact(path: Path) -> Any:
+    """Read a JSON artifact written by `write_json_artifact` (plain or gzipped)."""
+    if path.suffix == _GZIP_SUFFIX:
+        with gzip.open(path, "rb") as handle:
+            return from_json(handle.read())
+    return from_json(path.read_bytes())
@@ -1,10 +1,10 @@
 """Export evidence preview JSON into JSONL eval records.
 
 Usage:
-    python scripts/runs/export_eval_jsonl.py data/evidence_previews/evidence_preview_20260116_020157.json
-    python scripts/runs/export_eval_jsonl.py data/evidence_previews/evidence_preview_20260116_020157.json data/evidence_previews/evidence_preview_20260116_020157.jsonl
+    python -m scripts.runs.export_eval_jsonl data/evidence_previews/evidence_preview_20260116_020157.json.gz
+    python -m scripts.runs.export_eval_jsonl data/evidence_previews/evidence_preview_20260116_020157.json data/evidence_previews/evidence_preview_20260116_020157.jsonl
 """
-# Run: python scripts/runs/export_eval_jsonl.py data/evidence_previews/evidence_preview_20260116_020157.json
+# Run: python -m scripts.runs.export_eval_jsonl data/evidence_previews/evidence_preview_20260116_020157.json
 
 from __future__ import annotations
 
@@ -24,12 +24,8 @@ def _trim_evidence_request(request: dict[str, Any] | None) -> dict[str, Any] | N
         payload.pop("top_comment_excerpts", None)
     return trimmed
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from config.logging_config import get_logger
+from scripts.runs.artifact_io import atomic_write_bytes, read_json_artifact
 
 logger = get_logger(__name__)
 
@@ -37,7 +33,7 @@ logger = get_logger(__name__)
 def _load_records(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"Preview JSON not found: {path}")
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = read_json_artifact(path)
     if not isinstance(payload, list):
         raise ValueError("Preview JSON must be a list of records.")
     return payload
@@ -76,14 +72,15 @@ def _write_jsonl(records: list[dict[str, Any]], output_path: Path) -> None:
         json.dumps(record, ensure_ascii=True, separators=(",", ":"))
         for record in records
     ]
-    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    atomic_write_bytes(output_path, ("\n".join(lines) + "\n").encode("utf-8"))
 
 
 def main() -> None:
     if len(sys.argv) < 2:
-        raise SystemExit("Usage: python scripts/runs/export_eval_jsonl.py INPUT_JSON [OUTPUT_JSONL]")
+        raise SystemExit("Usage: python -m scripts.runs.export_eval_jsonl INPUT_JSON [OUTPUT_JSONL]")
     input_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else input_path.with_suffix(".jsonl")
+    default_output = input_path.with_suffix("") if input_path.suffix == ".gz" else input_path
+    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else default_output.with_suffix(".jsonl")
 
     raw_records = _load_records(input_path)
     eval_records = [
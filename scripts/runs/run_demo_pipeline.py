@@ -1,10 +1,10 @@
 """Run the demo evidence pipeline with a single query.
 
 Usage:
-    python scripts/runs/run_demo_pipeline.py
-    python scripts/runs/run_demo_pipeline.py "my floor squeaks when I walk on it"
+    python -m scripts.runs.run_demo_pipeline
+    python -m scripts.runs.run_demo_pipeline "my floor squeaks when I walk on it"
 """
-# Run: python scripts/runs/run_demo_pipeline.py "my floor squeaks when I walk on it"
+# Run: python -m scripts.runs.run_demo_pipeline "my floor squeaks when I walk on it"
 
 from __future__ import annotations
 
@@ -13,14 +13,11 @@ import sys
 from datetime import UTC, datetime
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 import asyncio
 
 from config.logging_config import configure_logging, get_logger
 from api.pipeline import run_pipeline
+from scripts.runs.artifact_io import atomic_write_bytes
 
 configure_logging()
 logger = get_logger(__name__)
@@ -42,7 +39,7 @@ def main() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     output_path = OUTPUT_DIR / f"demo_run_{timestamp}.json"
-    output_path.write_text(json.dumps(artifact, indent=2), encoding="utf-8")
+    atomic_write_bytes(output_path, json.dumps(artifact, indent=2).encode("utf-8"))
 
     logger.info("demo.complete", output_path=str(output_path))
 
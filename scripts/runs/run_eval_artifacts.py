@@ -1,16 +1,8 @@
 """CLI wrapper for generating eval artifacts from evidence previews."""
-# Run: python scripts/runs/run_eval_artifacts.py --config config/run_config.yaml --mode fixture_only
+# Run: python -m scripts.runs.run_eval_artifacts --config config/run_config.yaml --mode fixture_only
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from scripts.runs.run_evidence_preview import app
 
 
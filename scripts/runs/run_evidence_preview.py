@@ -1,11 +1,9 @@
 """Preview harness for the evidence pipeline."""
-# Run: python scripts/runs/run_evidence_preview.py --config config/run_config.yaml --mode fixture_only
+# Run: python -m scripts.runs.run_evidence_preview --config config/run_config.yaml --mode fixture_only
 
 from __future__ import annotations
 
 import asyncio
-import json
-import sys
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -14,11 +12,6 @@ from typing import Any
 import typer
 import yaml
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from agent.clients.openai_client import get_openai_client
 from agent.planner.core import create_search_plan
 from config.logging_config import configure_logging, get_logger
@@ -31,6 +24,7 @@ from services.synthesizer.llm_execution.types import PromptMessage
 from services.synthesizer.models import EvidenceRequest, EvidenceResult
 from services.synthesizer.context_builder import build_context_request
 from services.context_builder.config import ContextBuilderConfig
+from scripts.runs.artifact_io import write_json_artifact
 
 logger = get_logger(__name__)
 app = typer.Typer(add_completion=False)
@@ -144,6 +138,9 @@ def main(
         "--mode",
         help="Mode to run: fixture_only or fixture_and_llm.",
     ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Write indented, uncompressed JSON instead of compact gzip."
+    ),
 ) -> None:
     """Run the evidence preview for one or more queries."""
     run_start = time.perf_counter()
@@ -331,8 +328,8 @@ def main(
         )
         return
 
-    output_path.write_text(json.dumps(preview_payload, indent=2), encoding="utf-8")
-    logger.info("Evidence preview saved to data/evidence_previews/%s", output_name)
+    output_path = write_json_artifact(output_path, preview_payload, pretty=pretty)
+    logger.info("Evidence preview saved to %s", output_path)
     logger.info(
         "Evidence preview finished (queries=%d, total_s=%.2f).",
         len(queries),
@@ -341,8 +338,4 @@ def main(
 
 
 if __name__ == "__main__":
-    if __package__ is None or __package__ == "":
-        PROJECT_ROOT = Path(__file__).resolve().parents[2]
-        if str(PROJECT_ROOT) not in sys.path:
-            sys.path.insert(0, str(PROJECT_ROOT))
     app()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import sys
 import json
 from datetime import datetime, UTC
 from pathlib import Path
@@ -11,14 +10,10 @@ from typing import List
 
 import typer
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from agent.planner.core import create_search_plan
 from config.logging_config import get_logger
 from services.fetch.reddit_fetcher import run_reddit_fetcher
+from scripts.runs.artifact_io import atomic_write_bytes
 
 logger = get_logger(__name__)
 app = typer.Typer(add_completion=False)
@@ -118,7 +113,7 @@ def run(
 
     timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     summary_path = EVAL_DIR / f"fetch_eval_{timestamp}.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    atomic_write_bytes(summary_path, json.dumps(summary, indent=2).encode("utf-8"))
     logger.info("Fetch evaluation complete (summary saved to %s).", summary_path)
 
 
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import sys
 import time
 from datetime import datetime, UTC
 from pathlib import Path
@@ -12,14 +10,10 @@ from typing import List
 
 import typer
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from agent.planner.core import create_search_plan
 from config.logging_config import get_logger
 from services.fetch.reddit_fetcher import run_reddit_fetcher
+from scripts.runs.artifact_io import write_json_artifact
 
 logger = get_logger(__name__)
 app = typer.Typer(add_completion=False)
@@ -51,17 +45,22 @@ def _load_queries(queries_file: Path | None) -> list[str]:
     return queries
 
 
-def _post_preview(post, max_comments: int = 5) -> dict:
-    comments_preview = [
-        {
-            "comment_id": comment.comment_id,
-            "body": comment.body,
-            "comment_karma": comment.comment_karma,
-        }
-        for comment in post.comments[:max_comments]
-    ]
+def _post_preview(post, max_comments: int = 5, max_body_chars: int = 500) -> dict:
+    comments_preview = []
+    for comment in post.comments[:max_comments]:
+        body = comment.body or ""
+        comments_preview.append(
+            {
+                "comment_id": comment.comment_id,
+                "body": body[:max_body_chars],
+                "body_truncated": len(body) > max_body_chars,
+                "comment_karma": comment.comment_karma,
+            }
+        )
+    title = post.title or ""
     return {
-        "title": post.title,
+        "title": title[:max_body_chars],
+        "title_truncated": len(title) > max_body_chars,
         "subreddit": post.subreddit,
         "permalink": post.url,
         "post_karma": post.post_karma,
@@ -80,6 +79,12 @@ def run(
     environment: str = typer.Option("dev", "--environment", help="Reddit client environment."),
     max_posts: int = typer.Option(5, "--max-posts", help="Preview up to N posts per query."),
     max_comments: int = typer.Option(5, "--max-comments", help="Preview up to N comments per post."),
+    max_body_chars: int = typer.Option(
+        500, "--max-body-chars", help="Truncate previewed titles and comment bodies to N chars."
+    ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Write indented, uncompressed JSON instead of compact gzip."
+    ),
 ) -> None:
     """Produce a JSON file with real post/comment content for inspection."""
     queries = _load_queries(queries_file)
@@ -133,7 +138,8 @@ def run(
             continue
 
         posts_preview = [
-            _post_preview(post, max_comments=max_comments) for post in fetch_result.posts[:max_posts]
+            _post_preview(post, max_comments=max_comments, max_body_chars=max_body_chars)
+            for post in fetch_result.posts[:max_posts]
         ]
 
         preview_payload.append(
@@ -151,7 +157,18 @@ def run(
     total_elapsed = time.perf_counter() - total_start
     timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     preview_path = PREVIEW_DIR / f"fetch_preview_{timestamp}.json"
-    preview_path.write_text(json.dumps(preview_payload, indent=2), encoding="utf-8")
+    # plan_id is minted fresh by create_search_plan on every run; leave it out
+    # of the digest so an otherwise identical preview is still deduped.
+    stable_payload = [
+        {key: value for key, value in entry.items() if key != "plan_id"} for entry in preview_payload
+    ]
+    preview_path = write_json_artifact(
+        preview_path,
+        preview_payload,
+        pretty=pretty,
+        skip_unchanged=True,
+        digest_payload=stable_payload,
+    )
     logger.info(
         "All queries done in %.2fs (count=%d)",
         total_elapsed,
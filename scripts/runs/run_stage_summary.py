@@ -1,16 +1,14 @@
 """Generate middle-range pipeline stage summary artifacts.
 
 Usage:
-    python scripts/runs/run_stage_summary.py --config config/run_config.yaml
-    python scripts/runs/run_stage_summary.py --config config/run_config.yaml --label scnA
+    python -m scripts.runs.run_stage_summary --config config/run_config.yaml
+    python -m scripts.runs.run_stage_summary --config config/run_config.yaml --label scnA
 """
-# Run: python scripts/runs/run_stage_summary.py --config config/run_config.yaml
+# Run: python -m scripts.runs.run_stage_summary --config config/run_config.yaml
 
 from __future__ import annotations
 
 import asyncio
-import json
-import sys
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -19,19 +17,10 @@ from typing import Any
 import typer
 import yaml
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from config.logging_config import configure_logging, get_logger
 from api.pipeline import _run_pipeline
-from services.synthesizer.stage_summary import (
-    build_stage_diagnostics,
-    summarize_evidence_result,
-    summarize_fetch_result,
-    summarize_llm_context,
-)
+from scripts.runs.artifact_io import write_json_artifact
+from services.synthesizer.stage_summary import build_all_summaries
 
 logger = get_logger(__name__)
 app = typer.Typer(add_completion=False)
@@ -72,6 +61,9 @@ def main(
         "--label",
         help="Optional run label appended to the output filename (e.g., scnA).",
     ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Write indented, uncompressed JSON instead of compact gzip."
+    ),
 ) -> None:
     """Run stage-boundary summaries for one or more queries."""
     run_start = time.perf_counter()
@@ -89,14 +81,12 @@ def main(
     payload: list[dict[str, Any]] = []
     for query_text in queries:
         plan, fetch_result, request, result = asyncio.run(_run_pipeline(query_text, config))
-        fetch_result_summary = summarize_fetch_result(fetch_result)
-        llm_context_summary = summarize_llm_context(request)
-        evidence_result_summary = summarize_evidence_result(result)
-        diagnostics = build_stage_diagnostics(
+        (
             fetch_result_summary,
             llm_context_summary,
             evidence_result_summary,
-        )
+            diagnostics,
+        ) = build_all_summaries(fetch_result, request, result)
         record = {
             "query": query_text,
             "search_plan": {
@@ -110,7 +100,15 @@ def main(
         }
         payload.append(record)
 
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # The label is part of the requested filename, so only dedupe against a
+    # previous run written under the same label.
+    output_path = write_json_artifact(
+        output_path,
+        payload,
+        pretty=pretty,
+        skip_unchanged=True,
+        digest_payload={"label": output_label, "payload": payload},
+    )
     logger.info("Pipeline stage summary saved to %s", output_path)
     logger.info(
         "Pipeline stage summary finished (queries=%d, total_s=%.2f).",
@@ -1,34 +1,84 @@
-"""Generate a SearchPlan JSON file with a unique name."""
+"""Generate a SearchPlan JSON file with a unique name.
+
+Plans are indexed by a hash of the normalized query in data/plans/index.json;
+re-running with a query that already has a saved plan skips the planner call.
+"""
 
 from __future__ import annotations
 
-import sys
+import fcntl
+import hashlib
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import typer
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from agent.planner.core import create_search_plan
 from config.logging_config import get_logger
+from scripts.runs.artifact_io import atomic_write_bytes
 
 logger = get_logger(__name__)
 app = typer.Typer(add_completion=False)
 
+OUTPUT_DIR = Path("data/plans")
+INDEX_FILENAME = "index.json"
+LOCK_FILENAME = "index.lock"
+
+
+def _query_key(query: str) -> str:
+    normalized = " ".join(query.split()).lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def _index_lock(output_dir: Path) -> Iterator[None]:
+    """Hold an exclusive POSIX lock so concurrent runs don't clobber the index."""
+    with (output_dir / LOCK_FILENAME).open("a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _load_index(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_index(path: Path, index: dict[str, str]) -> None:
+    atomic_write_bytes(path, json.dumps(index, indent=2, sort_keys=True).encode("utf-8"))
+
 
 @app.command()
-def run(query: str = typer.Argument(..., help="User query for SearchPlan generation.")) -> None:
-    output_dir = Path("data/plans")
+def run(
+    query: str = typer.Argument(..., help="User query for SearchPlan generation."),
+    force: bool = typer.Option(False, "--force", help="Regenerate even if a plan exists."),
+) -> None:
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
+    index_path = output_dir / INDEX_FILENAME
+    key = _query_key(query)
+
+    cached_name = _load_index(index_path).get(key)
+    if cached_name and not force and (output_dir / cached_name).exists():
+        logger.info("Plan already saved for query at %s; skipping planner", output_dir / cached_name)
+        return
+
     plan = create_search_plan(query)
 
     short_id = plan.plan_id.hex[:8]
     filename = f"plan_{short_id}.json"
     path = output_dir / filename
-    path.write_text(plan.model_dump_json(indent=2), encoding="utf-8")
+    atomic_write_bytes(path, plan.model_dump_json(indent=2).encode("utf-8"))
+
+    with _index_lock(output_dir):
+        index = _load_index(index_path)
+        index[key] = filename
+        _write_index(index_path, index)
 
     logger.info("Saved plan to %s", path)
 
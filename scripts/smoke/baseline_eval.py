@@ -8,18 +8,11 @@ and write outcomes to a timestamped JSONL file for quick regressions.
 from __future__ import annotations
 
 import json
-import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from time import perf_counter
 from typing import Any
 
-if __package__ is None or __package__ == "":
-    # Allow running as `python scripts/smoke/baseline_eval.py` by adding repo root.
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from agent.planner import SearchPlan, create_search_plan
 from config.logging_config import get_logger
 from pydantic import ValidationError
@@ -1,15 +1,7 @@
 import logging
-from pathlib import Path
-import sys
 
 import typer
 
-# Ensure repo root is on sys.path when running directly
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from config.logging_config import get_logger, configure_logging
 from agent.planner import create_search_plan
 
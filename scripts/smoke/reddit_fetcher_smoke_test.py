@@ -5,15 +5,9 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-import sys
 
 import typer
 
-if __package__ is None or __package__ == "":
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
 from agent.planner.model import SearchPlan
 from services.fetch.reddit_fetcher import run_reddit_fetcher
 from config.logging_config import get_logger
@@ -2,6 +2,24 @@
 
 Summary:
     Small, idempotent cache for embedding vectors keyed by content digest + model.
+    Reads use one query-only connection per (thread, database path), so lookups
+    never queue behind each other. Writes share a single connection per database
+    path behind a lock, which serializes writers in-process instead of leaving
+    them to spin on SQLite's busy timeout; under WAL they do not block readers.
+    A thread's reader connections are closed when that thread exits; writers
+    are closed at interpreter exit.
+
+Durability:
+    The database runs in WAL mode with synchronous=NORMAL, so commits are not
+    fsynced individually; WAL checkpoints are. A power loss can drop the most
+    recent writes but never corrupts the file. Lost entries are just cache
+    misses that get re-embedded on the next run.
+
+Quantization:
+    Vectors are stored as float32 ("f32") by default. With quantization="scalar"
+    they are stored as int8 ("i8"): a float32 scale followed by one signed byte
+    per dimension, about 4x smaller. Reads dequantize back to float32 by row
+    dtype, so both encodings can coexist in one database.
 
 Usage:
     from services.embedding.cache import init_cache, get_embedding, set_embedding
@@ -10,13 +28,18 @@ Usage:
     result = get_embedding("data/embedding_cache.sqlite3", digest, model)
     if result is None:
         set_embedding("data/embedding_cache.sqlite3", digest, model, dims, vector)
+    set_embedding_many("data/embedding_cache.sqlite3", [(digest, model, dims, vector)])
 """
 
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
+import weakref
 from array import array
-from typing import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 
 from config.logging_config import get_logger
 
@@ -25,45 +48,196 @@ logger = get_logger(__name__)
 _TABLE_NAME = "embeddings"
 _FLOAT32_ITEMSIZE = array("f").itemsize
 _BUSY_TIMEOUT_MS = 5000
+_CACHE_SIZE_KIB = 65536
+_MMAP_SIZE_BYTES = 10 * 1024**3
+# Stay well under SQLite's default limit on bound parameters per statement.
+_MAX_DIGESTS_PER_QUERY = 500
+_CACHED_STATEMENTS = 256
 
+DTYPE_FLOAT32 = "f32"
+DTYPE_INT8 = "i8"
+_QUANTIZATION_DTYPES = {"none": DTYPE_FLOAT32, "scalar": DTYPE_INT8}
+_INT8_MAX = 127
 
-def _connect(db_path: str) -> sqlite3.Connection:
-    connection = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT_MS / 1000)
+# WITHOUT ROWID stores rows in the primary-key B-tree itself, so a point
+# lookup by (content_digest, model) is a single tree descent.
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        content_digest TEXT NOT NULL,
+        model TEXT NOT NULL,
+        dims INTEGER NOT NULL,
+        embedding BLOB NOT NULL,
+        dtype TEXT NOT NULL DEFAULT 'f32',
+        PRIMARY KEY (content_digest, model)
+    ) WITHOUT ROWID
+"""
+_SELECT_SQL = (
+    f"SELECT dims, embedding, dtype FROM {_TABLE_NAME} WHERE content_digest = ? AND model = ?"
+)
+
+
+_local = threading.local()
+_open_connections: list[sqlite3.Connection] = []
+_open_connections_lock = threading.Lock()
+_writers: dict[str, tuple[sqlite3.Connection, threading.Lock]] = {}
+
+
+def _close_all(connections: dict[str, sqlite3.Connection]) -> None:
+    for connection in connections.values():
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+    connections.clear()
+
+
+class _ThreadReaders:
+    """One thread's read-only connections, keyed by database path.
+
+    Held only by the thread-local, so it is dropped when the thread exits (e.g.
+    a default executor torn down by asyncio.run) and its connections, each with
+    a large page cache and mmap, are closed then rather than at interpreter exit.
+    """
+
+    def __init__(self) -> None:
+        self.connections: dict[str, sqlite3.Connection] = {}
+        weakref.finalize(self, _close_all, self.connections)
+
+
+def _open_connection(db_path: str, *, query_only: bool = False) -> sqlite3.Connection:
+    # Reader connections stay on the thread that opened them and the writer is
+    # only used under its lock; disabling the same-thread check lets the writer
+    # move between threads and lets readers be closed after their thread exits.
+    connection = sqlite3.connect(
+        db_path,
+        timeout=_BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=False,
+        cached_statements=_CACHED_STATEMENTS,
+    )
     connection.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+    # Per-connection settings; journal_mode=WAL is persisted by init_cache.
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    connection.execute(f"PRAGMA cache_size = -{_CACHE_SIZE_KIB}")
+    connection.execute(f"PRAGMA mmap_size = {_MMAP_SIZE_BYTES}")
+    if query_only:
+        connection.execute("PRAGMA query_only = ON")
+    return connection
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Return this thread's cached read-only connection for db_path, opening it once."""
+    readers: _ThreadReaders | None = getattr(_local, "readers", None)
+    if readers is None:
+        readers = _ThreadReaders()
+        _local.readers = readers
+    connection = readers.connections.get(db_path)
+    if connection is None:
+        connection = _open_connection(db_path, query_only=True)
+        readers.connections[db_path] = connection
     return connection
 
 
+@contextmanager
+def _write_connection(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Hold the shared writer for db_path; the block runs as one transaction."""
+    with _open_connections_lock:
+        writer = _writers.get(db_path)
+    if writer is None:
+        connection = _open_connection(db_path)
+        with _open_connections_lock:
+            writer = _writers.setdefault(db_path, (connection, threading.Lock()))
+            if writer[0] is connection:
+                _open_connections.append(connection)
+        if writer[0] is not connection:
+            connection.close()
+    connection, lock = writer
+    with lock, connection:
+        yield connection
+
+
+@atexit.register
+def _close_connections() -> None:
+    with _open_connections_lock:
+        connections = list(_open_connections)
+        _open_connections.clear()
+        _writers.clear()
+    for connection in connections:
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+
+
+def _needs_without_rowid_migration(connection: sqlite3.Connection) -> bool:
+    row = connection.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (_TABLE_NAME,),
+    ).fetchone()
+    return row is not None and "WITHOUT ROWID" not in row[0].upper()
+
+
+def _migrate_to_without_rowid(connection: sqlite3.Connection) -> None:
+    """Rebuild a cache table created before the WITHOUT ROWID layout."""
+    staging_table = f"{_TABLE_NAME}_migration"
+    connection.executescript(
+        f"""
+        BEGIN IMMEDIATE;
+        DROP TABLE IF EXISTS {staging_table};
+        {_CREATE_TABLE_SQL.format(table=staging_table)};
+        INSERT INTO {staging_table} (content_digest, model, dims, embedding)
+            SELECT content_digest, model, dims, embedding FROM {_TABLE_NAME};
+        DROP TABLE {_TABLE_NAME};
+        ALTER TABLE {staging_table} RENAME TO {_TABLE_NAME};
+        COMMIT;
+        """
+    )
+    logger.info("embedding.cache_migrated", layout="without_rowid")
+
+
+def _ensure_dtype_column(connection: sqlite3.Connection) -> None:
+    """Add the dtype column to tables created before quantization support."""
+    columns = {row[1] for row in connection.execute(f"PRAGMA table_info({_TABLE_NAME})")}
+    if "dtype" not in columns:
+        connection.execute(
+            f"ALTER TABLE {_TABLE_NAME} ADD COLUMN dtype TEXT NOT NULL DEFAULT '{DTYPE_FLOAT32}'"
+        )
+
+
 def init_cache(db_path: str) -> None:
     """Initialize the SQLite cache schema and connection settings."""
     try:
-        with _connect(db_path) as connection:
+        with _write_connection(db_path) as connection:
             connection.execute("PRAGMA journal_mode = WAL")
-            connection.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS {_TABLE_NAME} (
-                    content_digest TEXT NOT NULL,
-                    model TEXT NOT NULL,
-                    dims INTEGER NOT NULL,
-                    embedding BLOB NOT NULL,
-                    PRIMARY KEY (content_digest, model)
-                )
-                """
-            )
+            if _needs_without_rowid_migration(connection):
+                _migrate_to_without_rowid(connection)
+            else:
+                connection.execute(_CREATE_TABLE_SQL.format(table=_TABLE_NAME))
+                _ensure_dtype_column(connection)
             connection.commit()
     except sqlite3.Error as exc:
         logger.warning("embedding.cache_init_failed", error=str(exc))
 
 
-def serialize_vector(vector: Iterable[float]) -> bytes:
-    """Serialize a float vector into float32 bytes."""
+def serialize_vector(vector: Iterable[float] | bytes | bytearray | memoryview) -> bytes:
+    """Serialize a float vector into float32 bytes.
+
+    float32 arrays and raw float32 buffers are copied as-is; any other
+    iterable is converted element by element.
+    """
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        return bytes(vector)
+    if isinstance(vector, array) and vector.typecode == "f":
+        return vector.tobytes()
     buffer = array("f", vector)
     return buffer.tobytes()
 
 
-def deserialize_vector(blob: bytes, dims: int) -> list[float] | None:
-    """Deserialize float32 bytes into a float vector.
+def deserialize_vector(blob: bytes, dims: int) -> array[float] | None:
+    """Deserialize float32 bytes into a float32 array.
 
-    Returns None when the blob length does not match dims.
+    The array keeps the packed 4-byte layout instead of boxing each element
+    into a Python float. Returns None when the blob length does not match dims.
     """
     if dims <= 0:
         return None
@@ -72,27 +246,58 @@ def deserialize_vector(blob: bytes, dims: int) -> list[float] | None:
         return None
     buffer = array("f")
     buffer.frombytes(blob)
-    return list(buffer)
+    return buffer
+
+
+def quantize_vector(vector: Iterable[float]) -> bytes:
+    """Scalar-quantize a vector to a float32 scale plus one int8 per dimension."""
+    values = vector if isinstance(vector, array) else array("f", vector)
+    max_abs = max(map(abs, values), default=0.0)
+    scale = max_abs / _INT8_MAX if max_abs else 1.0
+    quantized = array("b", [round(value / scale) for value in values])
+    return array("f", [scale]).tobytes() + quantized.tobytes()
+
+
+def dequantize_vector(blob: bytes, dims: int) -> array[float] | None:
+    """Reverse quantize_vector. Returns None when the blob length does not match dims."""
+    if dims <= 0 or len(blob) != _FLOAT32_ITEMSIZE + dims:
+        return None
+    scale = array("f", blob[:_FLOAT32_ITEMSIZE])[0]
+    quantized = array("b")
+    quantized.frombytes(blob[_FLOAT32_ITEMSIZE:])
+    return array("f", [value * scale for value in quantized])
+
+
+def encode_vector(vector: Iterable[float], quantization: str = "none") -> tuple[bytes, str]:
+    """Return (blob, dtype) for a vector under the given quantization mode."""
+    dtype = _QUANTIZATION_DTYPES.get(quantization)
+    if dtype is None:
+        raise ValueError(f"Unsupported embedding cache quantization: {quantization}")
+    if dtype == DTYPE_INT8:
+        return quantize_vector(vector), dtype
+    return serialize_vector(vector), dtype
+
+
+def _decode_vector(blob: bytes, dims: int, dtype: str) -> array[float] | None:
+    if dtype == DTYPE_INT8:
+        return dequantize_vector(blob, dims)
+    return deserialize_vector(blob, dims)
 
 
 def get_embedding(
     db_path: str,
     content_digest: str,
     model: str,
-) -> tuple[list[float], int] | None:
+) -> tuple[array[float], int] | None:
     """Fetch an embedding by (content_digest, model)."""
     try:
         with _connect(db_path) as connection:
-            cursor = connection.execute(
-                f"SELECT dims, embedding FROM {_TABLE_NAME} "
-                "WHERE content_digest = ? AND model = ?",
-                (content_digest, model),
-            )
+            cursor = connection.execute(_SELECT_SQL, (content_digest, model))
             row = cursor.fetchone()
         if not row:
             return None
-        dims, blob = row
-        vector = deserialize_vector(blob, int(dims))
+        dims, blob, dtype = row
+        vector = _decode_vector(blob, int(dims), dtype)
         if vector is None:
             logger.warning("embedding.cache_entry_invalid", digest=content_digest, model=model)
             return None
@@ -102,26 +307,80 @@ def get_embedding(
         return None
 
 
+def get_embedding_many(
+    db_path: str,
+    content_digests: Iterable[str],
+    model: str,
+) -> dict[str, tuple[array[float], int]]:
+    """Fetch embeddings for many digests, returning only the ones found.
+
+    Digests are looked up with chunked IN-list queries rather than one
+    query per digest.
+    """
+    unique_digests = list(dict.fromkeys(content_digests))
+    found: dict[str, tuple[array[float], int]] = {}
+    try:
+        with _connect(db_path) as connection:
+            for start in range(0, len(unique_digests), _MAX_DIGESTS_PER_QUERY):
+                chunk = unique_digests[start : start + _MAX_DIGESTS_PER_QUERY]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = connection.execute(
+                    f"SELECT content_digest, dims, embedding, dtype FROM {_TABLE_NAME} "
+                    f"WHERE model = ? AND content_digest IN ({placeholders})",
+                    (model, *chunk),
+                )
+                for content_digest, dims, blob, dtype in cursor:
+                    vector = _decode_vector(blob, int(dims), dtype)
+                    if vector is None:
+                        logger.warning("embedding.cache_entry_invalid", digest=content_digest, model=model)
+                        continue
+                    found[content_digest] = (vector, int(dims))
+    except sqlite3.Error as exc:
+        logger.warning("embedding.cache_read_failed", error=str(exc))
+    return found
+
+
+_UPSERT_SQL = f"""
+    INSERT INTO {_TABLE_NAME} (content_digest, model, dims, embedding, dtype)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(content_digest, model)
+    DO UPDATE SET dims = excluded.dims, embedding = excluded.embedding, dtype = excluded.dtype
+"""
+
+
 def set_embedding(
     db_path: str,
     content_digest: str,
     model: str,
     dims: int,
     vector: Iterable[float],
+    *,
+    quantization: str = "none",
 ) -> None:
     """Store an embedding by (content_digest, model)."""
     try:
-        blob = serialize_vector(vector)
-        with _connect(db_path) as connection:
-            connection.execute(
-                f"""
-                INSERT INTO {_TABLE_NAME} (content_digest, model, dims, embedding)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(content_digest, model)
-                DO UPDATE SET dims = excluded.dims, embedding = excluded.embedding
-                """,
-                (content_digest, model, int(dims), blob),
-            )
-            connection.commit()
+        blob, dtype = encode_vector(vector, quantization)
+        with _write_connection(db_path) as connection:
+            connection.execute(_UPSERT_SQL, (content_digest, model, int(dims), blob, dtype))
     except sqlite3.Error as exc:
         logger.warning("embedding.cache_write_failed", error=str(exc))
+
+
+def set_embedding_many(
+    db_path: str,
+    rows: Iterable[tuple[str, str, int, Iterable[float]]],
+    *,
+    quantization: str = "none",
+) -> None:
+    """Store many (content_digest, model, dims, vector) rows in one transaction."""
+    params = [
+        (content_digest, model, int(dims), *encode_vector(vector, quantization))
+        for content_digest, model, dims, vector in rows
+    ]
+    if not params:
+        return
+    try:
+        with _write_connection(db_path) as connection:
+            connection.executemany(_UPSERT_SQL, params)
+    except sqlite3.Error as exc:
+        logger.warning("embedding.cache_write_failed", error=str(exc), n_rows=len(params))
@@ -23,7 +23,10 @@ Usage:
 
 from __future__ import annotations
 
+import contextvars
 import hashlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
 import openai
 from openai import OpenAI
@@ -64,15 +67,15 @@ def content_digest(normalized_text: str) -> str:
 
 
 @_embedding_retry
-def _fetch_embedding(*, client: OpenAI, model: str, text: str) -> list[float]:
+def _fetch_embedding(*, client: OpenAI, model: str, text: str) -> array[float]:
     response = client.embeddings.create(model=model, input=text)
-    return list(response.data[0].embedding)
+    return array("f", response.data[0].embedding)
 
 
 @_embedding_retry
-def _fetch_embeddings(*, client: OpenAI, model: str, texts: list[str]) -> list[list[float]]:
+def _fetch_embeddings(*, client: OpenAI, model: str, texts: list[str]) -> list[array[float]]:
     response = client.embeddings.create(model=model, input=texts)
-    return [list(item.embedding) for item in sorted(response.data, key=lambda x: x.index)]
+    return [array("f", item.embedding) for item in sorted(response.data, key=lambda x: x.index)]
 
 
 class EmbeddingClient:
@@ -83,7 +86,7 @@ class EmbeddingClient:
         self._model = model
         self._store = store
 
-    def embed(self, text: str) -> tuple[list[float], int]:
+    def embed(self, text: str) -> tuple[array[float], int]:
         normalized = normalize_text(text)
         if not normalized:
             raise EmbeddingError("Embedding text is empty after normalization")
@@ -106,19 +109,21 @@ class EmbeddingClient:
         self._store.set_embedding(digest, self._model, dims, vector)
         return vector, dims
 
-    def embed_texts(self, texts: list[str]) -> list[list[float] | None]:
+    def embed_texts(self, texts: list[str]) -> list[array[float] | None]:
         """Embed a list of texts, returning a vector per input or None on failure.
 
         Results are parallel to the input list. None is returned for any input
         that is empty after normalization or whose chunk fails after retries.
-        Cache is checked before any API call; misses are sent in batched chunks.
+        Cache is checked before any API call; misses are sent in batched chunks,
+        with up to a few chunks in flight at once.
         """
         _MAX_INPUTS_PER_CHUNK = 2048
         _MAX_TOKENS_PER_CHUNK = 300_000
         _CHARS_PER_TOKEN = 4
+        _MAX_PARALLEL_CHUNKS = 4
 
         normalized = [normalize_text(t) for t in texts]
-        results: list[list[float] | None] = [None] * len(texts)
+        results: list[array[float] | None] = [None] * len(texts)
 
         valid_indices: list[int] = []
         for i, norm in enumerate(normalized):
@@ -127,12 +132,14 @@ class EmbeddingClient:
                 continue
             valid_indices.append(i)
 
+        digests = {i: content_digest(normalized[i]) for i in valid_indices}
+        cached = self._store.get_embedding_many(digests.values(), self._model)
+
         miss_indices: list[int] = []
         for i in valid_indices:
-            digest = content_digest(normalized[i])
-            cached = self._store.get_embedding(digest, self._model)
-            if cached is not None:
-                results[i] = cached[0]
+            hit = cached.get(digests[i])
+            if hit is not None:
+                results[i] = hit[0]
             else:
                 miss_indices.append(i)
 
@@ -157,13 +164,13 @@ class EmbeddingClient:
         if current_chunk:
             chunks.append(current_chunk)
 
-        for chunk_index, chunk in enumerate(chunks):
-            chunk_texts = [normalized[i] for i in chunk]
+        def _fetch_chunk(chunk_index: int) -> list[array[float]] | None:
+            chunk = chunks[chunk_index]
             try:
-                vectors = _fetch_embeddings(
+                return _fetch_embeddings(
                     client=self._client,
                     model=self._model,
-                    texts=chunk_texts,
+                    texts=[normalized[i] for i in chunk],
                 )
             except openai.APIError as exc:
                 logger.warning(
@@ -172,13 +179,29 @@ class EmbeddingClient:
                     n_affected=len(chunk),
                     error=str(exc),
                 )
+                return None
+
+        if len(chunks) == 1:
+            chunk_vectors = [_fetch_chunk(0)]
+        else:
+            # The OpenAI client is thread-safe; cache writes stay on this thread.
+            # Each chunk runs in a copy of this context so plan_id still reaches
+            # worker-thread logs.
+            with ThreadPoolExecutor(max_workers=min(len(chunks), _MAX_PARALLEL_CHUNKS)) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, _fetch_chunk, chunk_index)
+                    for chunk_index in range(len(chunks))
+                ]
+                chunk_vectors = [future.result() for future in futures]
+
+        for chunk, vectors in zip(chunks, chunk_vectors):
+            if vectors is None:
                 continue
-
-            for response_index, original_index in enumerate(chunk):
-                vector = vectors[response_index]
-                digest = content_digest(normalized[original_index])
-                self._store.set_embedding(digest, self._model, len(vector), vector)
+            rows = []
+            for original_index, vector in zip(chunk, vectors):
+                rows.append((digests[original_index], self._model, len(vector), vector))
                 results[original_index] = vector
+            self._store.set_embedding_many(rows)
 
         return results
 
@@ -14,13 +14,14 @@ Usage:
 from __future__ import annotations
 
 import time
+from array import array
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from config.logging_config import get_logger
 from config.settings import settings
 from services.embedding.client import EmbeddingClient, EmbeddingError
-from services.embedding.similarity import cosine_similarity
+from services.embedding.similarity import cosine_similarity_batch
 from services.fetch.reddit_builders import build_post_model
 from services.fetch.schemas import Post
 
@@ -47,7 +48,7 @@ def _truncate_text(text: str, max_chars: int) -> str:
 def embed_query(
     ranking_input: RankingInput,
     embedder: EmbeddingClient,
-) -> tuple[list[float], int]:
+) -> tuple[array[float], int]:
     """Compute the query embedding once per run.
 
     Raises EmbeddingError if the embedding cannot be retrieved.
@@ -60,7 +61,7 @@ def embed_query(
 
 def rank_candidates(
     ranking_input: RankingInput,
-    query_embedding: tuple[list[float], int],
+    query_embedding: tuple[array[float], int],
     embedder: EmbeddingClient,
 ) -> list[Post]:
     """Return scored Post models from candidates."""
@@ -77,14 +78,10 @@ def rank_candidates(
     ]
 
     post_vectors = embedder.embed_texts(post_texts)
+    scores = cosine_similarity_batch(query_vector, post_vectors)
 
     scored: list[Post] = []
-    for candidate, vector in zip(ranking_input.candidates, post_vectors):
-        if vector is None:
-            score = 0.0
-        else:
-            score = cosine_similarity(query_vector, vector)
-
+    for candidate, score in zip(ranking_input.candidates, scores):
         scored.append(
             build_post_model(
                 # URL, karma, and subreddit are derived from raw_post in build_post_model.
@@ -7,14 +7,16 @@ Usage:
     from services.embedding.similarity import cosine_similarity
 
     score = cosine_similarity([1.0, 0.0], [0.5, 0.5])
+    scores = cosine_similarity_batch([1.0, 0.0], [[0.5, 0.5], None])
 """
 
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
     """Return cosine similarity between two vectors.
 
     Returns 0.0 for empty inputs, length mismatch, or zero-norm vectors.
@@ -23,16 +25,39 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
         return 0.0
     if len(a) != len(b):
         return 0.0
+    if a is b:
+        return 1.0 if any(a) else 0.0
 
-    dot = 0.0
-    norm_a = 0.0
-    norm_b = 0.0
-    for x, y in zip(a, b, strict=True):
-        dot += x * y
-        norm_a += x * x
-        norm_b += y * y
-
+    # math.sumprod runs the multiply-accumulate loop in C.
+    norm_a = math.sumprod(a, a)
+    norm_b = math.sumprod(b, b)
     if norm_a == 0.0 or norm_b == 0.0:
         return 0.0
 
-    return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+    return math.sumprod(a, b) / math.sqrt(norm_a * norm_b)
+
+
+def cosine_similarity_batch(
+    query: Sequence[float],
+    vectors: Sequence[Sequence[float] | None],
+) -> list[float]:
+    """Score many vectors against one query, computing the query norm once.
+
+    Missing (None), empty, mismatched, or zero-norm vectors score 0.0.
+    """
+    scores = [0.0] * len(vectors)
+    if not query:
+        return scores
+    norm_query = math.sumprod(query, query)
+    if norm_query == 0.0:
+        return scores
+
+    dims = len(query)
+    for i, vector in enumerate(vectors):
+        if not vector or len(vector) != dims:
+            continue
+        norm_vector = math.sumprod(vector, vector)
+        if norm_vector == 0.0:
+            continue
+        scores[i] = math.sumprod(query, vector) / math.sqrt(norm_query * norm_vector)
+    return scores
@@ -12,20 +12,35 @@ Usage:
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
 
 class VectorStore(Protocol):
     """Minimal vector store interface for embeddings."""
 
-    def get_embedding(self, content_digest: str, model: str) -> tuple[list[float], int] | None:
+    def get_embedding(self, content_digest: str, model: str) -> tuple[array[float], int] | None:
         """Return (vector, dims) or None when missing."""
 
+    def get_embedding_many(
+        self,
+        content_digests: Iterable[str],
+        model: str,
+    ) -> dict[str, tuple[array[float], int]]:
+        """Return {digest: (vector, dims)} for the digests that are stored."""
+
     def set_embedding(
         self,
         content_digest: str,
         model: str,
         dims: int,
-        vector: list[float],
+        vector: Sequence[float],
     ) -> None:
         """Persist the vector under (content_digest, model)."""
+
+    def set_embedding_many(
+        self,
+        rows: Iterable[tuple[str, str, int, Sequence[float]]],
+    ) -> None:
+        """Persist many (content_digest, model, dims, vector) rows in one batch."""
@@ -11,14 +11,29 @@ Usage:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from config.settings import settings
 from services.embedding.store import VectorStore
 from services.embedding.stores.sqlite_store import SQLiteVectorStore
 
 
+@lru_cache(maxsize=8)
+def _build_vector_store(store_type: str, cache_path: str, quantization: str) -> VectorStore:
+    if store_type == "sqlite":
+        return SQLiteVectorStore(cache_path, quantization=quantization)
+    raise ValueError(f"Unsupported vector store type: {store_type}")
+
+
 def get_vector_store() -> VectorStore:
-    """Return the configured vector store implementation."""
+    """Return the configured vector store implementation.
+
+    Stores are built once per (type, path, quantization) and reused, so schema setup runs
+    once per process rather than on every fetch.
+    """
     store_type = settings.VECTOR_STORE_TYPE.lower().strip()
-    if store_type == "sqlite":
-        return SQLiteVectorStore(settings.EMBEDDING_CACHE_PATH)
-    raise ValueError(f"Unsupported vector store type: {settings.VECTOR_STORE_TYPE}")
+    return _build_vector_store(
+        store_type,
+        settings.EMBEDDING_CACHE_PATH,
+        settings.EMBEDDING_CACHE_QUANT,
+    )
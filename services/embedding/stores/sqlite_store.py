@@ -1,7 +1,8 @@
 """SQLite-backed vector store implementation.
 
 Summary:
-    Stores embeddings in a local SQLite database using the shared cache module.
+    Stores embeddings in a local SQLite database using the shared cache module,
+    with a bounded in-process LRU in front of it for repeat lookups.
 
 Usage:
     from services.embedding.stores.sqlite_store import SQLiteVectorStore
@@ -13,25 +14,136 @@ Usage:
 
 from __future__ import annotations
 
-from services.embedding.cache import get_embedding, init_cache, set_embedding
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+
+from services.embedding.cache import (
+    dequantize_vector,
+    get_embedding,
+    get_embedding_many,
+    init_cache,
+    quantize_vector,
+    set_embedding,
+    set_embedding_many,
+)
 from services.embedding.store import VectorStore
 
+DEFAULT_MEMORY_CACHE_SIZE = 4096
+
+_CacheKey = tuple[str, str]
+_CacheEntry = tuple[array[float], int]
+
+
+def _as_float32(vector: Sequence[float]) -> array[float]:
+    if isinstance(vector, array) and vector.typecode == "f":
+        return vector
+    return array("f", vector)
+
 
 class SQLiteVectorStore(VectorStore):
-    """SQLite vector store wrapper using embedding cache helpers."""
+    """SQLite vector store wrapper using embedding cache helpers.
 
-    def __init__(self, db_path: str) -> None:
+    Cached vectors are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
+        quantization: str = "none",
+    ) -> None:
         self._db_path = db_path
+        self._quantization = quantization
+        self._memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
         init_cache(self._db_path)
 
-    def get_embedding(self, content_digest: str, model: str) -> tuple[list[float], int] | None:
-        return get_embedding(self._db_path, content_digest, model)
+    def clear_cache(self) -> None:
+        """Drop all in-process cached vectors (the SQLite data is untouched)."""
+        with self._memory_cache_lock:
+            self._memory_cache.clear()
+
+    def _cache_get(self, key: _CacheKey) -> _CacheEntry | None:
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                self._memory_cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key: _CacheKey, entry: _CacheEntry) -> None:
+        if self._memory_cache_size <= 0:
+            return
+        with self._memory_cache_lock:
+            self._memory_cache[key] = entry
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self._memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+    def _put_written(self, key: _CacheKey, vector: array[float], dims: int) -> None:
+        """Cache a just-written vector as it will read back from SQLite."""
+        if self._quantization == "scalar":
+            # Keep warm and fresh processes scoring the same text identically.
+            stored = dequantize_vector(quantize_vector(vector), dims)
+            if stored is None:
+                return
+            vector = stored
+        self._cache_put(key, (vector, dims))
+
+    def get_embedding(self, content_digest: str, model: str) -> tuple[array[float], int] | None:
+        key = (content_digest, model)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result = get_embedding(self._db_path, content_digest, model)
+        if result is not None:
+            self._cache_put(key, result)
+        return result
+
+    def get_embedding_many(
+        self,
+        content_digests: Iterable[str],
+        model: str,
+    ) -> dict[str, tuple[array[float], int]]:
+        found: dict[str, tuple[array[float], int]] = {}
+        missing: list[str] = []
+        for content_digest in content_digests:
+            cached = self._cache_get((content_digest, model))
+            if cached is not None:
+                found[content_digest] = cached
+            else:
+                missing.append(content_digest)
+        if missing:
+            loaded = get_embedding_many(self._db_path, missing, model)
+            for content_digest, entry in loaded.items():
+                self._cache_put((content_digest, model), entry)
+            found.update(loaded)
+        return found
 
     def set_embedding(
         self,
         content_digest: str,
         model: str,
         dims: int,
-        vector: list[float],
+        vector: Sequence[float],
+    ) -> None:
+        vector = _as_float32(vector)
+        set_embedding(
+            self._db_path, content_digest, model, dims, vector, quantization=self._quantization
+        )
+        self._put_written((content_digest, model), vector, int(dims))
+
+    def set_embedding_many(
+        self,
+        rows: Iterable[tuple[str, str, int, Sequence[float]]],
     ) -> None:
-        set_embedding(self._db_path, content_digest, model, dims, vector)
+        packed = [
+            (content_digest, model, int(dims), _as_float32(vector))
+            for content_digest, model, dims, vector in rows
+        ]
+        set_embedding_many(self._db_path, packed, quantization=self._quantization)
+        for content_digest, model, dims, vector in packed:
+            self._put_written((content_digest, model), vector, dims)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
 from typing import Any
 
 from config.logging_config import get_logger
@@ -42,9 +44,6 @@ def filter_comments(
         if is_auto_moderator(raw_comment):
             logger.debug("fetch.comment_rejected", reason="automoderator", comment_id=comment_id)
             continue
-        if is_deleted_or_removed(raw_comment.get("body")):
-            logger.debug("fetch.comment_rejected", reason="deleted_or_removed", comment_id=comment_id)
-            continue
 
         score = raw_comment.get("score")
         karma = int(score) if isinstance(score, (int, float)) else 0
@@ -52,7 +51,18 @@ def filter_comments(
             logger.debug("fetch.comment_rejected", reason="low_karma", comment_id=comment_id)
             continue
 
-        cleaned_body = clean_text(raw_comment.get("body", ""))
+        raw_body = raw_comment.get("body")
+        # None (and any non-string body) counts as deleted.
+        if not isinstance(raw_body, str) or is_deleted_or_removed(raw_body):
+            logger.debug("fetch.comment_rejected", reason="deleted_or_removed", comment_id=comment_id)
+            continue
+        # Cleaning only strips markup, so skip the markdown/HTML pass for
+        # bodies that are already under the minimum length.
+        if is_comment_too_short(raw_body):
+            logger.debug("fetch.comment_rejected", reason="too_short", comment_id=comment_id)
+            continue
+
+        cleaned_body = clean_text(raw_body)
         if is_comment_too_short(cleaned_body):
             logger.debug("fetch.comment_rejected", reason="too_short", comment_id=comment_id)
             continue
@@ -65,10 +75,7 @@ def filter_comments(
                 comment_karma=karma,
             )
         )
-    if not filtered:
-        return []
-    filtered.sort(key=lambda comment: comment["comment_karma"], reverse=True)
-    return filtered[:max_comments]
+    return heapq.nlargest(max_comments, filtered, key=itemgetter("comment_karma"))
 
 
 __all__ = ["filter_comments"]
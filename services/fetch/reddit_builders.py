@@ -6,6 +6,9 @@ from typing import Any
 
 from .schemas import Comment, Post
 
+REDDIT_WEB_BASE_URL = "https://www.reddit.com/"
+_COMMENTS_BASE_URL = REDDIT_WEB_BASE_URL + "comments/"
+
 # TODO: Add unit tests for builder functions to ensure payloads map to models.
 
 
@@ -45,7 +48,7 @@ def build_post_model(
     post_karma = raw_post.get("score")
     permalink = post_permalink(raw_post)
     raw_subreddit = raw_post.get("subreddit") or ""
-    subreddit = raw_subreddit.lower().lstrip("r/") if isinstance(raw_subreddit, str) else ""
+    subreddit = normalize_subreddit(raw_subreddit) if isinstance(raw_subreddit, str) else ""
     return Post(
         id=raw_post["id"],
         subreddit=subreddit,
@@ -60,21 +63,24 @@ def build_post_model(
     )
 
 
+def normalize_subreddit(name: str) -> str:
+    """Lowercase a subreddit name and drop a leading "r/" or "/r/" prefix."""
+    return name.lower().removeprefix("/").removeprefix("r/")
+
+
 def post_permalink(raw_post: dict[str, Any]) -> str:
     """Return a canonical Reddit permalink for the submission."""
     permalink = raw_post.get("permalink")
     if isinstance(permalink, str) and permalink:
         if permalink.startswith("http"):
             return permalink
-        trimmed = permalink.lstrip("/")
-        return f"https://www.reddit.com/{trimmed}"
+        return REDDIT_WEB_BASE_URL + permalink.lstrip("/")
 
     url = raw_post.get("url")
     if isinstance(url, str) and url.startswith("http"):
         return url
 
-    post_id = raw_post.get("id", "")
-    return f"https://www.reddit.com/comments/{post_id}"
+    return _COMMENTS_BASE_URL + str(raw_post.get("id", ""))
 
 
 def build_comment_payload(
@@ -96,6 +102,7 @@ def build_comment_payload(
 __all__ = [
     "build_comment_models",
     "build_post_model",
+    "normalize_subreddit",
     "post_permalink",
     "build_comment_payload",
 ]
@@ -1,5 +1,10 @@
 import asyncio
+import atexit
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,7 +20,7 @@ from services.reddit_client import RedditClient
 
 from .comment_pipeline import filter_comments
 from .content_filters import has_seen_post, is_post_too_short
-from .reddit_builders import build_comment_models, build_post_model
+from .reddit_builders import build_comment_models, build_post_model, normalize_subreddit
 from .reddit_validation import passes_post_validation
 from .schemas import Comment, FetchResult, Post
 from .scoring import evaluate_post_relevance
@@ -24,6 +29,13 @@ from .utils.text_utils import clean_text
 
 logger = get_logger(__name__)
 
+# Reddit accepts combined subreddit paths (r/a+b+c); keep groups small enough
+# that the URL and per-group listing stay reasonable.
+MAX_SUBREDDITS_PER_SEARCH = 25
+
+_cpu_pool: ProcessPoolExecutor | None = None
+_cpu_pool_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class PostCandidate:
@@ -62,40 +74,151 @@ def _score_post_candidates(candidates: list[PostCandidate]) -> list[Post]:
     return scored
 
 
+def _unique_terms(terms: list[str]) -> list[str]:
+    """Drop repeated search terms (case/whitespace-insensitive), keeping first occurrences.
+
+    Reddit search is case-insensitive, so duplicates would only repeat identical requests.
+    """
+    unique: dict[str, str] = {}
+    for term in terms:
+        unique.setdefault(" ".join(term.split()).casefold(), term)
+    return list(unique.values())
+
+
+def _group_subreddits(subreddits: list[str], size: int = MAX_SUBREDDITS_PER_SEARCH) -> list[list[str]]:
+    """Split subreddits into groups that can share one combined search request."""
+    return [subreddits[i : i + size] for i in range(0, len(subreddits), size)]
+
+
+def _get_cpu_pool() -> ProcessPoolExecutor | None:
+    """Return the shared comment-filtering process pool, or None when disabled."""
+    global _cpu_pool
+    if settings.FETCHER_CPU_WORKERS <= 0:
+        return None
+    with _cpu_pool_lock:
+        if _cpu_pool is None:
+            _cpu_pool = ProcessPoolExecutor(max_workers=settings.FETCHER_CPU_WORKERS)
+            atexit.register(_cpu_pool.shutdown, cancel_futures=True)
+        return _cpu_pool
+
+
+async def _fetch_comment_models(
+    *,
+    client: RedditClient,
+    post_id: str,
+    fetched_at: float,
+) -> list[Comment]:
+    """Fetch one post's comments and reduce them to Comment models right away.
+
+    Filtering as each listing arrives lets the raw payloads (with fields such as
+    body_html and awardings that are never read) be freed one by one, instead of
+    holding every post's full listing until the whole gather completes.
+    """
+    raw_comments = await client.fetch_comments(post_id=post_id)
+    pool = _get_cpu_pool()
+    if pool is None:
+        filtered_comments = filter_comments(
+            post_id=post_id,
+            raw_comments=raw_comments,
+            max_comments=settings.FETCHER_MAX_COMMENTS_PER_POST,
+        )
+    else:
+        # clean_text is GIL-bound; run it in worker processes so listings for
+        # different posts are cleaned in parallel and the event loop stays free.
+        filtered_comments = await asyncio.get_running_loop().run_in_executor(
+            pool,
+            filter_comments,
+            post_id,
+            raw_comments,
+            settings.FETCHER_MAX_COMMENTS_PER_POST,
+        )
+    return build_comment_models(filtered_comments, fetched_at)
+
+
+def _clean_post(raw_post: dict[str, Any], post_id: str) -> tuple[str, str] | None:
+    """Validate a raw post and return its (cleaned_title, cleaned_body), or None if rejected."""
+    if not passes_post_validation(raw_post):
+        return None
+    raw_body = raw_post.get("selftext", "")
+    # Cleaning only strips markup, so bodies already under the minimum
+    # can be rejected before the markdown/HTML pass.
+    if is_post_too_short(raw_body):
+        logger.debug("fetch.post_rejected", reason="too_short", post_id=post_id)
+        return None
+    body = clean_text(raw_body)
+    if is_post_too_short(body):
+        logger.debug("fetch.post_rejected", reason="too_short", post_id=post_id)
+        return None
+    title = clean_text(raw_post.get("title", ""))
+    return title, body
+
+
 async def _fetch_posts_for_pair(
     *,
     subreddit: str,
     term: str,
     post_limit: int,
+    per_subreddit_limit: int,
     fetched_at: float,
     client: RedditClient,
+    comment_tasks: dict[str, asyncio.Task[list[Comment]]],
+    cleaned_posts: dict[str, tuple[str, str] | None],
 ) -> list[PostCandidate]:
     """Fetch and filter posts for a single (subreddit, term) pair.
 
+    `subreddit` may be a combined path such as "diy+homeimprovement"; each raw
+    post still carries its own subreddit for attribution. At most
+    `per_subreddit_limit` listing items are taken from any one subreddit, the
+    same quota a per-subreddit search had, so a busy subreddit cannot fill the
+    whole group limit. A quiet subreddit that ranks low in the combined
+    listing can still contribute fewer posts than it would from its own
+    search; that is the coverage cost of one request per group.
+
+    `comment_tasks` is shared across all pairs in a run and maps post_id to its
+    comment fetch. The first pair to reach Phase 2 with a post starts the
+    fetch; every other pair that found the same post awaits that task, so each
+    post's comments are requested once per run. A failure in this pair's
+    search never stops other pairs from keeping the post.
+
+    `cleaned_posts` is the run-wide memo of `_clean_post` results, so a post
+    returned by several terms is validated and cleaned only once.
+
     Phase 1: stream paginate_search, apply text filters.
-    Phase 2: gather all comment fetches concurrently, then build PostCandidates.
+    Phase 2: fetch and filter each post's comments concurrently, then build PostCandidates.
     """
     # (post_id, raw_post, cleaned_title, cleaned_body)
     filtered: list[tuple[str, dict[str, Any], str, str]] = []
     local_seen_post_ids: set[str] = set()
+    subreddit_counts: Counter[str] = Counter()
 
     try:
-        async for raw_post in client.paginate_search(subreddit=subreddit, query=term, limit=post_limit):
-            post_id = raw_post.get("id")
-            if not post_id:
-                logger.debug("fetch.post_rejected", reason="no_id", subreddit=subreddit, term=term)
-                continue
-            if not passes_post_validation(raw_post):
-                continue
-            title = clean_text(raw_post.get("title", ""))
-            body = clean_text(raw_post.get("selftext", ""))
-            if is_post_too_short(body):
-                logger.debug("fetch.post_rejected", reason="too_short", post_id=post_id)
-                continue
-            if has_seen_post(post_id, local_seen_post_ids):
-                logger.debug("fetch.post_rejected", reason="duplicate", post_id=post_id)
-                continue
-            filtered.append((post_id, raw_post, title, body))
+        async with aclosing(
+            client.paginate_search(subreddit=subreddit, query=term, limit=post_limit)
+        ) as raw_posts:
+            async for raw_post in raw_posts:
+                post_id = raw_post.get("id")
+                if not post_id:
+                    logger.debug("fetch.post_rejected", reason="no_id", subreddit=subreddit, term=term)
+                    continue
+                post_subreddit = normalize_subreddit(raw_post.get("subreddit") or "")
+                if subreddit_counts[post_subreddit] >= per_subreddit_limit:
+                    logger.debug("fetch.post_rejected", reason="subreddit_quota", post_id=post_id, subreddit=post_subreddit)
+                    continue
+                subreddit_counts[post_subreddit] += 1
+                if has_seen_post(post_id, local_seen_post_ids):
+                    logger.debug("fetch.post_rejected", reason="duplicate", post_id=post_id)
+                    continue
+                # Validation and cleaning depend only on the post, so a post
+                # found by several terms is checked and cleaned once per run.
+                if post_id in cleaned_posts:
+                    cleaned = cleaned_posts[post_id]
+                else:
+                    cleaned = _clean_post(raw_post, post_id)
+                    cleaned_posts[post_id] = cleaned
+                if cleaned is None:
+                    continue
+                title, body = cleaned
+                filtered.append((post_id, raw_post, title, body))
     except (ExternalTimeoutError, RateLimitError, InvalidResponseError) as exc:
         logger.warning("fetch.request_failed", context="search", subreddit=subreddit, term=term, exc_type=type(exc).__name__, error=str(exc))
         return []
@@ -103,23 +226,27 @@ async def _fetch_posts_for_pair(
     if not filtered:
         return []
 
-    # Phase 2: fetch all comments concurrently.
+    # Phase 2: fetch all comments concurrently, sharing in-flight fetches.
+    fetches: list[asyncio.Task[list[Comment]]] = []
+    for post_id, _, _, _ in filtered:
+        task = comment_tasks.get(post_id)
+        if task is None:
+            task = asyncio.create_task(
+                _fetch_comment_models(client=client, post_id=post_id, fetched_at=fetched_at)
+            )
+            comment_tasks[post_id] = task
+        fetches.append(task)
+    # shield: cancelling this pair must not cancel fetches other pairs await.
     comment_results = await asyncio.gather(
-        *[client.fetch_comments(post_id=post_id) for post_id, _, _, _ in filtered],
+        *[asyncio.shield(task) for task in fetches],
         return_exceptions=True,
     )
 
     candidates: list[PostCandidate] = []
-    for (post_id, raw_post, title, body), comment_result in zip(filtered, comment_results):
-        if isinstance(comment_result, Exception):
-            logger.warning("fetch.request_failed", context="comments", post_id=post_id, exc_type=type(comment_result).__name__, error=str(comment_result))
+    for (post_id, raw_post, title, body), comment_models in zip(filtered, comment_results):
+        if isinstance(comment_models, Exception):
+            logger.warning("fetch.request_failed", context="comments", post_id=post_id, exc_type=type(comment_models).__name__, error=str(comment_models))
             continue
-        filtered_comments = filter_comments(
-            post_id=post_id,
-            raw_comments=comment_result,
-            max_comments=settings.FETCHER_MAX_COMMENTS_PER_POST,
-        )
-        comment_models = build_comment_models(filtered_comments, fetched_at)
         if not comment_models:
             logger.debug("fetch.post_rejected", reason="no_comments", post_id=post_id)
             continue
@@ -150,12 +277,16 @@ async def run_reddit_fetcher(
     accepted_posts: list[Post] = []
     candidate_posts: list[PostCandidate] = []
     seen_post_ids: set[str] = set()
+    comment_tasks: dict[str, asyncio.Task[list[Comment]]] = {}
+    cleaned_posts: dict[str, tuple[str, str] | None] = {}
     plan_query = plan.query
 
+    # One search per (subreddit group, term); the group limit scales with its
+    # size, and each subreddit keeps its own post_limit quota within the group.
     tasks = [
-        (subreddit, term)
-        for subreddit in plan.subreddits
-        for term in plan.search_terms
+        ("+".join(group), term, post_limit * len(group))
+        for group in _group_subreddits(plan.subreddits)
+        for term in _unique_terms(plan.search_terms)
     ]
     logger.info("fetch.start", n_tasks=len(tasks), post_limit=post_limit)
 
@@ -174,14 +305,17 @@ async def run_reddit_fetcher(
                     client=reddit_client,
                     subreddit=subreddit,
                     term=term,
-                    post_limit=post_limit,
+                    post_limit=group_limit,
+                    per_subreddit_limit=post_limit,
                     fetched_at=fetched_at,
+                    comment_tasks=comment_tasks,
+                    cleaned_posts=cleaned_posts,
                 )
-                for subreddit, term in tasks
+                for subreddit, term, group_limit in tasks
             ],
             return_exceptions=True,
         )
-        for (subreddit, term), result in zip(tasks, results):
+        for (subreddit, term, _), result in zip(tasks, results):
             if isinstance(result, Exception):
                 logger.warning("fetch.concurrent_failed", subreddit=subreddit, term=term, error=str(result))
             else:
@@ -16,15 +16,25 @@ SHOWCASE_KEYWORDS = tuple(
     keyword.lower()
     for keyword in NEGATIVE_KEYWORDS.get("showcase_brag", {}).get("keywords", [])
 )
+# A phrase containing a shorter showcase keyword ("how i turned" vs "how i")
+# can never change the result of a substring check, so it is not scanned.
+_SHOWCASE_SCAN_KEYWORDS = tuple(
+    keyword
+    for keyword in dict.fromkeys(SHOWCASE_KEYWORDS)
+    if not any(other != keyword and other in keyword for other in SHOWCASE_KEYWORDS)
+)
 SHOWCASE_KARMA_THRESHOLD = 150
+_DELETED_SENTINELS = frozenset({"", "[deleted]", "[removed]"})
+_MAX_SENTINEL_LENGTH = max(map(len, _DELETED_SENTINELS))
 
 
 def is_deleted_or_removed(text: str | None) -> bool:
     """Return True when the body/selftext is missing or marked deleted."""
     if text is None:
         return True
-    normalized = text.strip().lower()
-    return normalized in {"", "[deleted]", "[removed]"}
+    stripped = text.strip()
+    # Only lowercase strings short enough to be a sentinel; real bodies skip the copy.
+    return len(stripped) <= _MAX_SENTINEL_LENGTH and stripped.lower() in _DELETED_SENTINELS
 
 
 def is_auto_moderator(raw_item: dict[str, Any]) -> bool:
@@ -58,9 +68,10 @@ def is_showcase_post(raw_post: dict[str, Any]) -> bool:
         return False
     if not _has_image_hint(raw_post):
         return False
-    if not _has_showcase_phrase(raw_post):
+    # Most posts fail the karma check; do it before any string work.
+    if not _has_high_karma(raw_post):
         return False
-    return _has_high_karma(raw_post)
+    return _has_showcase_phrase(raw_post)
 
 
 def _has_image_hint(raw_post: dict[str, Any]) -> bool:
@@ -71,8 +82,11 @@ def _has_image_hint(raw_post: dict[str, Any]) -> bool:
 
 
 def _has_showcase_phrase(raw_post: dict[str, Any]) -> bool:
-    text = f"{raw_post.get('title', '')} {raw_post.get('selftext', '')}".lower()
-    return any(keyword in text for keyword in SHOWCASE_KEYWORDS)
+    title = (raw_post.get("title") or "").lower()
+    if any(keyword in title for keyword in _SHOWCASE_SCAN_KEYWORDS):
+        return True
+    body = (raw_post.get("selftext") or "").lower()
+    return any(keyword in body for keyword in _SHOWCASE_SCAN_KEYWORDS)
 
 
 def _has_high_karma(raw_post: dict[str, Any]) -> bool:
@@ -83,24 +97,28 @@ def _has_high_karma(raw_post: dict[str, Any]) -> bool:
 
 
 def passes_post_validation(raw_post: dict[str, Any]) -> bool:
-    """Apply metadata veto checks before cleaning/scoring."""
+    """Apply metadata veto checks before cleaning/scoring.
+
+    Flag lookups run first; checks that touch the post text run last, so most
+    rejections never scan the body.
+    """
     post_id = raw_post.get("id")
-    if is_deleted_or_removed(raw_post.get("selftext")):
-        logger.debug("fetch.post_rejected", post_id=post_id, reason="deleted_or_removed")
-        return False
     if is_auto_moderator(raw_post):
         logger.debug("fetch.post_rejected", post_id=post_id, reason="automoderator")
         return False
+    if is_nsfw(raw_post):
+        logger.debug("fetch.post_rejected", post_id=post_id, reason="nsfw")
+        return False
     if is_created_from_ads_ui(raw_post):
         logger.debug("fetch.post_rejected", post_id=post_id, reason="ads_ui")
         return False
     if not is_self_post(raw_post):
         logger.debug("fetch.post_rejected", post_id=post_id, reason="non_self_post")
         return False
+    if is_deleted_or_removed(raw_post.get("selftext")):
+        logger.debug("fetch.post_rejected", post_id=post_id, reason="deleted_or_removed")
+        return False
     if is_showcase_post(raw_post):
         logger.debug("fetch.post_rejected", post_id=post_id, reason="showcase_post")
         return False
-    if is_nsfw(raw_post):
-        logger.debug("fetch.post_rejected", post_id=post_id, reason="nsfw")
-        return False
     return True
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import logging
 import re
-from typing import Iterable, List, Tuple
+from typing import Iterable, List
 
 from config.logging_config import get_logger
 
@@ -16,7 +17,12 @@ from .keyword_groups import (
 
 logger = get_logger(__name__)
 
-_SUFFIXES: Tuple[str, ...] = ("", "s", "ed", "ing")
+# Optional inflections accepted after a single-word keyword.
+_SUFFIX_PATTERN = "(?:s|ed|ing)?"
+
+# (keyword, pattern) pairs plus one alternation covering the whole group, so a
+# group with no hits costs a single regex scan instead of one per variant.
+_KeywordMatchers = tuple[re.Pattern[str], tuple[tuple[str, re.Pattern[str]], ...]]
 
 
 def evaluate_post_relevance(
@@ -31,72 +37,86 @@ def evaluate_post_relevance(
     negative_matches: list[str] = []
     relevance_score = 0.0
 
-    for group_name, group in KEYWORD_GROUPS.items():
-        weight = KEYWORD_WEIGHTS.get(group_name, 0.0)
-        matches = _find_matches(group["keywords"], combined_text)
+    for weight, matchers in _POSITIVE_GROUPS:
+        matches = _find_matches(matchers, combined_text)
         if matches:
             relevance_score += weight
             positive_matches.extend(matches)
 
     if not positive_matches:
-        for group_name, group in NEGATIVE_KEYWORDS.items():
-            weight = KEYWORD_WEIGHTS.get(group_name, 0.0)
-            matches = _find_matches(group["keywords"], combined_text)
+        for weight, matchers in _NEGATIVE_GROUPS:
+            matches = _find_matches(matchers, combined_text)
             if matches:
                 relevance_score += weight
                 negative_matches.extend(matches)
 
     passed_threshold = relevance_score >= MIN_POST_SCORE
-    decision_reason = _decision_reason(
-        passed_threshold,
-        positive_matches,
-        negative_matches,
-    )
-
-    log_message = (
-        "Post accepted by keyword scoring"
-        if passed_threshold
-        else "Post rejected by keyword scoring"
-    )
-
-    logger.debug(
-        log_message,
-        extra={
-            "post_id": post_id,
-            "relevance_score": relevance_score,
-            "matched_keywords": ", ".join(positive_matches),
-            "negative_keywords": ", ".join(negative_matches),
-            "threshold": MIN_POST_SCORE,
-            "decision": "accepted" if passed_threshold else "rejected",
-            "decision_reason": decision_reason,
-        },
-    )
+    # The decision log is DEBUG-only; skip building its payload otherwise.
+    if logger.is_enabled_for(logging.DEBUG):
+        decision_reason = _decision_reason(
+            passed_threshold,
+            positive_matches,
+            negative_matches,
+        )
+
+        log_message = (
+            "Post accepted by keyword scoring"
+            if passed_threshold
+            else "Post rejected by keyword scoring"
+        )
+
+        logger.debug(
+            log_message,
+            extra={
+                "post_id": post_id,
+                "relevance_score": relevance_score,
+                "matched_keywords": ", ".join(positive_matches),
+                "negative_keywords": ", ".join(negative_matches),
+                "threshold": MIN_POST_SCORE,
+                "decision": "accepted" if passed_threshold else "rejected",
+                "decision_reason": decision_reason,
+            },
+        )
 
     return relevance_score, positive_matches, negative_matches, passed_threshold
 
 
-def _find_matches(keywords: Iterable[str], text: str) -> List[str]:
-    matches: list[str] = []
-    for keyword in keywords:
-        normalized = keyword.lower()
-        for variant in _expand_variants(normalized):
-            if _contains_variant(text, variant):
-                matches.append(keyword)
-                break
-    return matches
+def _find_matches(matchers: _KeywordMatchers, text: str) -> List[str]:
+    group_pattern, keyword_patterns = matchers
+    if not group_pattern.search(text):
+        return []
+    return [keyword for keyword, pattern in keyword_patterns if pattern.search(text)]
 
 
-def _expand_variants(keyword: str) -> Tuple[str, ...]:
+def _variant_pattern(keyword: str) -> str:
+    keyword = keyword.lower()
+    if not keyword:
+        return ""
     if " " in keyword:
-        return (keyword,)
-    return tuple(f"{keyword}{suffix}" for suffix in _SUFFIXES)
+        return re.escape(keyword)
+    return f"{re.escape(keyword)}{_SUFFIX_PATTERN}"
 
 
-def _contains_variant(text: str, variant: str) -> bool:
-    if not variant:
-        return False
-    pattern = rf"\b{re.escape(variant)}\b"
-    return bool(re.search(pattern, text))
+def _compile_matchers(keywords: Iterable[str]) -> _KeywordMatchers:
+    alternations = [(keyword, _variant_pattern(keyword)) for keyword in keywords]
+    alternations = [(keyword, alternation) for keyword, alternation in alternations if alternation]
+    keyword_patterns = tuple(
+        (keyword, re.compile(rf"\b(?:{alternation})\b")) for keyword, alternation in alternations
+    )
+    group_alternation = "|".join(alternation for _, alternation in alternations) or "(?!)"
+    return re.compile(rf"\b(?:{group_alternation})\b"), keyword_patterns
+
+
+# (weight, matchers) per group in declaration order, so scoring never touches
+# the group dicts or KEYWORD_WEIGHTS per post.
+_POSITIVE_GROUPS: tuple[tuple[float, _KeywordMatchers], ...] = tuple(
+    (KEYWORD_WEIGHTS.get(group_name, 0.0), _compile_matchers(group["keywords"]))
+    for group_name, group in KEYWORD_GROUPS.items()
+)
+_NEGATIVE_GROUPS: tuple[tuple[float, _KeywordMatchers], ...] = tuple(
+    (KEYWORD_WEIGHTS.get(group_name, 0.0), _compile_matchers(group["keywords"]))
+    for group_name, group in NEGATIVE_KEYWORDS.items()
+)
 
 
 def _decision_reason(
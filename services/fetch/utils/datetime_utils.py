@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 
 
 def utc_now() -> float:
     """Return the current UTC timestamp as a float."""
-    return datetime.now(timezone.utc).timestamp()
+    # time.time() is already seconds since the Unix epoch (UTC), without
+    # building a datetime per call.
+    return time.time()
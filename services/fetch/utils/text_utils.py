@@ -2,14 +2,86 @@
 
 from __future__ import annotations
 
+import html
 import re
+from html.parser import HTMLParser
 from typing import Final
 
-from bs4 import BeautifulSoup
 from markdown_it import MarkdownIt
 
 
 _MARKDOWN: Final[MarkdownIt] = MarkdownIt()
+_TAG_PATTERN: Final[re.Pattern[str]] = re.compile(r"<[^>]*>")
+_URL_PATTERN: Final[re.Pattern[str]] = re.compile(r"https?://\S+")
+# Anything CommonMark could turn into markup: inline/escape/entity/HTML characters
+# anywhere, plus list, heading-underline and thematic-break markers at line start.
+_MARKUP_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[\[\]*_`#<>&\\~!|\x00]|(?:^|[\r\n])[ \t]*(?:[-+=]|\d+[.)])"
+)
+
+
+class _TextExtractor(HTMLParser):
+    """Collect text nodes from rendered markdown without building a parse tree.
+
+    Mirrors BeautifulSoup's get_text(" ") on html.parser: adjacent data between
+    tags is one node, nodes are joined with a space, CDATA is kept, and
+    script/style/template contents, comments and declarations are dropped.
+    Malformed raw HTML passed through from a post (e.g. entities inside an
+    unclosed tag) can still come out slightly differently.
+    """
+
+    _SKIPPED_TAGS = frozenset({"script", "style", "template"})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+        self._in_text = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._in_text = False
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self._in_text = False
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data: str) -> None:
+        self._in_text = False
+
+    def handle_decl(self, decl: str) -> None:
+        self._in_text = False
+
+    def handle_pi(self, data: str) -> None:
+        self._in_text = False
+
+    def unknown_decl(self, data: str) -> None:
+        self._in_text = False
+        if data.startswith("CDATA["):
+            self.parts.append(data[len("CDATA[") :])
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_text:
+            self.parts[-1] += data
+        else:
+            self.parts.append(data)
+            self._in_text = True
+
+
+def _html_to_text(markup: str) -> str:
+    extractor = _TextExtractor()
+    try:
+        extractor.feed(markup)
+        extractor.close()
+    except (AssertionError, ValueError):
+        # Malformed raw HTML passed through from the post (e.g. a broken
+        # "<![" section); fall back to stripping tags outright.
+        return html.unescape(_TAG_PATTERN.sub(" ", markup))
+    return " ".join(extractor.parts)
 
 
 def clean_text(text: str | None) -> str:
@@ -17,15 +89,16 @@ def clean_text(text: str | None) -> str:
     if not text:
         return ""
 
-    html = _MARKDOWN.render(text)
-    soup = BeautifulSoup(html, "html.parser")
-
-    for anchor in soup.find_all("a"):
-        anchor.attrs.pop("href", None)
-
-    plain_text = soup.get_text(" ")
-    plain_text = re.sub(r"https?://\S+", "", plain_text)
-    plain_text = re.sub(r"\s+", " ", plain_text).strip()
-    plain_text = re.sub(r"[^\x00-\x7F]+", "", plain_text)
+    if _MARKUP_PATTERN.search(text):
+        # Only text nodes are kept, so link hrefs never reach the output.
+        plain_text = _html_to_text(_MARKDOWN.render(text))
+    else:
+        # Plain prose renders to the same text, so skip the markdown/HTML round trip.
+        plain_text = text
+    if "http" in plain_text:
+        plain_text = _URL_PATTERN.sub("", plain_text)
+    # str.split() splits on the same characters as \s+ and drops the ends.
+    plain_text = " ".join(plain_text.split())
+    plain_text = plain_text.encode("ascii", "ignore").decode("ascii")
 
     return plain_text
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from typing import Any
 
 import httpx
@@ -77,15 +78,20 @@ class RedditClient:
         subreddit: str,
         query: str,
         limit: int,
-    ) -> AsyncIterator[dict[str, Any]]:
+    ) -> AsyncGenerator[dict[str, Any], None]:
         try:
-            async for post in paginate_search(
-                await self._client(),
-                subreddit=subreddit,
-                query=query,
-                limit=limit,
-            ):
-                yield post
+            # aclosing: if our caller stops early, cancel the page prefetch now
+            # instead of leaving it to garbage collection.
+            async with aclosing(
+                paginate_search(
+                    await self._client(),
+                    subreddit=subreddit,
+                    query=query,
+                    limit=limit,
+                )
+            ) as posts:
+                async for post in posts:
+                    yield post
         except httpx.HTTPError as exc:
             raise _translate(exc) from exc
 
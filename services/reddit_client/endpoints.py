@@ -7,15 +7,20 @@ than 429) are re-raised immediately as `httpx.HTTPStatusError`.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncGenerator
 from typing import Any
 
 import httpx
+from pydantic_core import from_json
 
 from services.http.retry_policy import build_retry
 
 SEARCH_PATH_TEMPLATE = "/r/{subreddit}/search"
 COMMENTS_PATH_TEMPLATE = "/comments/{post_id}"
+# Reddit's maximum listing page size; combined-subreddit searches ask for
+# several subreddits' worth of posts, so fewer, larger pages cut round trips.
+SEARCH_PAGE_SIZE = 100
 
 
 def _is_retryable_request(exc: Exception) -> bool:
@@ -30,6 +35,11 @@ def _is_retryable_request(exc: Exception) -> bool:
 _reddit_retry = build_retry(is_retryable=_is_retryable_request)
 
 
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a listing body with pydantic-core's parser (faster than stdlib json on nested listings)."""
+    return from_json(response.content)
+
+
 @_reddit_retry
 async def search_subreddit(
     client: httpx.AsyncClient,
@@ -56,7 +66,7 @@ async def search_subreddit(
         timeout=10,
     )
     response.raise_for_status()
-    return response.json()
+    return _decode_json(response)
 
 
 async def paginate_search(
@@ -65,30 +75,64 @@ async def paginate_search(
     subreddit: str,
     query: str,
     limit: int,
-) -> AsyncIterator[dict[str, Any]]:
-    """Yield raw post dicts by walking the search listing."""
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Yield raw post dicts by walking the search listing.
+
+    As soon as a page's `after` cursor is known, the next page is requested in
+    the background so its round trip overlaps with the caller's work on the
+    current page. Callers that may stop iterating early should wrap the
+    generator in `contextlib.aclosing` so a pending prefetch is cancelled
+    right away rather than at garbage collection.
+    """
     remaining = max(limit, 0)
-    after: str | None = None
-    while remaining > 0:
-        page_limit = min(remaining, 25)
-        payload = await search_subreddit(
-            client,
-            subreddit=subreddit,
-            query=query,
-            limit=page_limit,
-            after=after,
-        )
-        children = payload.get("data", {}).get("children", [])
-        if not children:
-            break
-        for child in children:
-            yield child.get("data", {})
-            remaining -= 1
-            if remaining == 0:
+    if remaining == 0:
+        return
+    payload = await search_subreddit(
+        client,
+        subreddit=subreddit,
+        query=query,
+        limit=min(remaining, SEARCH_PAGE_SIZE),
+    )
+    next_page: asyncio.Task[Any] | None = None
+    try:
+        while True:
+            data = payload.get("data", {})
+            children = data.get("children", [])
+            if not children:
                 break
-        after = payload.get("data", {}).get("after")
-        if not after:
-            break
+            after = data.get("after")
+            left_after_page = remaining - len(children)
+            if after and left_after_page > 0:
+                next_page = asyncio.create_task(
+                    search_subreddit(
+                        client,
+                        subreddit=subreddit,
+                        query=query,
+                        limit=min(left_after_page, SEARCH_PAGE_SIZE),
+                        after=after,
+                    )
+                )
+            for child in children:
+                yield child.get("data", {})
+                remaining -= 1
+                if remaining == 0:
+                    break
+            if next_page is None:
+                break
+            payload = await next_page
+            next_page = None
+    finally:
+        if next_page is not None:
+            _discard_task(next_page)
+
+
+def _discard_task(task: asyncio.Task[Any]) -> None:
+    """Cancel a prefetch the caller no longer needs without leaking its error."""
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+        return
+    task.cancel()
 
 
 @_reddit_retry
@@ -108,7 +152,7 @@ async def fetch_comments(
     )
     response.raise_for_status()
 
-    payload = response.json()
+    payload = _decode_json(response)
     if not isinstance(payload, list) or len(payload) < 2:
         return []
     comments_listing = payload[1]
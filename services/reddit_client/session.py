@@ -14,11 +14,19 @@ from config.logging_config import get_logger
 from config.settings import settings
 from config.ssm import resolve_env_or_ssm_secret
 
+from .transport import (
+    ConcurrencyLimitedTransport,
+    RateLimitedTransport,
+    ResponseCacheTransport,
+    keepalive_socket_options,
+)
+
 logger = get_logger(__name__)
 
 TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
 API_BASE_URL = "https://oauth.reddit.com"
 DEFAULT_USER_AGENT = "Workbench/1.0 by /u/chippetto90"
+REQUEST_TIMEOUT_SECONDS = 10.0
 
 
 class AsyncRedditSession:
@@ -37,21 +45,48 @@ class AsyncRedditSession:
         client_secret: str,
         user_agent: str = DEFAULT_USER_AGENT,
         token_refresh_buffer: int = 60,
+        max_concurrent_requests: int | None = None,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_agent = user_agent
         self.token_refresh_buffer = token_refresh_buffer
 
+        max_concurrent_requests = max_concurrent_requests or settings.REDDIT_MAX_CONCURRENT_REQUESTS
+        # Keep one warm connection per concurrency slot so paginated fan-out
+        # reuses sockets instead of re-handshaking TLS.
+        limits = httpx.Limits(
+            max_connections=max_concurrent_requests,
+            max_keepalive_connections=max_concurrent_requests,
+        )
+        transport: httpx.AsyncBaseTransport = ConcurrencyLimitedTransport(
+            RateLimitedTransport(
+                httpx.AsyncHTTPTransport(
+                    limits=limits,
+                    http2=settings.REDDIT_HTTP2,
+                    socket_options=keepalive_socket_options(),
+                )
+            ),
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        if settings.REDDIT_RESPONSE_CACHE_PATH:
+            transport = ResponseCacheTransport(
+                transport,
+                path=settings.REDDIT_RESPONSE_CACHE_PATH,
+                ttl_seconds=settings.REDDIT_RESPONSE_CACHE_TTL_SECONDS,
+            )
         self._client = httpx.AsyncClient(
+            transport=transport,
             headers={
                 "User-Agent": self.user_agent,
                 "Accept": "application/json",
-            }
+            },
+            timeout=REQUEST_TIMEOUT_SECONDS,
         )
         self._token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
         self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task[None]] = None
 
     async def get_client(self) -> httpx.AsyncClient:
         """Return a valid, authorized client (refresh token if needed)."""
@@ -63,6 +98,9 @@ class AsyncRedditSession:
         return self._client
 
     async def aclose(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
         await self._client.aclose()
 
     def _token_expired(self) -> bool:
@@ -74,14 +112,12 @@ class AsyncRedditSession:
         """Refresh Reddit OAuth token."""
         logger.info("reddit.token_refresh")
         try:
-            async with httpx.AsyncClient() as tmp:
-                response = await tmp.post(
-                    TOKEN_URL,
-                    auth=(self.client_id, self.client_secret),
-                    data={"grant_type": "client_credentials"},
-                    headers={"User-Agent": self.user_agent},
-                    timeout=10,
-                )
+            # Reuse the pooled client; basic auth overrides any stale bearer header.
+            response = await self._client.post(
+                TOKEN_URL,
+                auth=(self.client_id, self.client_secret),
+                data={"grant_type": "client_credentials"},
+            )
             response.raise_for_status()
         except Exception as exc:
             raise AuthError(f"Failed to fetch token: {exc}") from exc
@@ -98,6 +134,29 @@ class AsyncRedditSession:
         )
         self._client.headers["Authorization"] = f"Bearer {self._token}"
         logger.info("reddit.session_authorized", expires_at=str(self._token_expiry))
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh in the background shortly before expiry so requests never wait on re-auth."""
+        if self._refresh_task is not None and self._refresh_task is not asyncio.current_task():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        if self._token_expiry is None:
+            return
+        delay = (self._token_expiry - datetime.now(timezone.utc)).total_seconds() - self.token_refresh_buffer
+        if delay <= 0:
+            # Token lifetime is too short to refresh ahead; get_client refreshes inline.
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_in_background(delay))
+
+    async def _refresh_in_background(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            async with self._lock:
+                await self._refresh_token()
+        except AuthError as exc:
+            # Leave the current token in place; get_client refreshes inline once it expires.
+            logger.warning("reddit.background_refresh_failed", error=str(exc))
 
     @classmethod
     def from_env(cls) -> "AsyncRedditSession":
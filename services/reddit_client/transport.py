@@ -0,0 +1,181 @@
+"""httpx transport wrappers applied to every Reddit API request."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import sqlite3
+import time
+from pathlib import Path
+
+import httpx
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+RATELIMIT_REMAINING_HEADER = "X-Ratelimit-Remaining"
+RATELIMIT_RESET_HEADER = "X-Ratelimit-Reset"
+
+TCP_KEEPALIVE_IDLE_SECONDS = 30
+TCP_KEEPALIVE_INTERVAL_SECONDS = 10
+TCP_KEEPALIVE_PROBES = 3
+
+
+def keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """Socket options that detect dead Reddit connections within about a minute.
+
+    The idle/interval/count knobs are only set where the platform exposes them
+    (macOS, for one, has no TCP_KEEPIDLE); SO_KEEPALIVE is always enabled.
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE_SECONDS),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL_SECONDS),
+        ("TCP_KEEPCNT", TCP_KEEPALIVE_PROBES),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            options.append((socket.IPPROTO_TCP, option, value))
+    return options
+
+
+class ConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    """Cap the number of in-flight requests sent through the wrapped transport.
+
+    Callers can fan out freely with asyncio.gather; requests beyond the limit
+    wait for a free slot instead of all hitting Reddit at once. A slot is held
+    until the response body has been read.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, max_concurrent_requests: int) -> None:
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        self._transport = transport
+        self._slots = asyncio.Semaphore(max_concurrent_requests)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._slots:
+            response = await self._transport.handle_async_request(request)
+            try:
+                await response.aread()
+            except BaseException:
+                await response.aclose()
+                raise
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """Pace requests using Reddit's X-Ratelimit-Remaining/Reset response headers.
+
+    Each request reserves one unit of the last reported budget. Once the budget
+    drops to `min_remaining`, new requests wait until the window resets instead
+    of drawing 429s and falling into retry back-off.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, min_remaining: int = 1) -> None:
+        self._transport = transport
+        self._min_remaining = min_remaining
+        self._remaining: float | None = None
+        self._reset_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _reserve(self) -> None:
+        async with self._lock:
+            if self._remaining is not None and self._remaining <= self._min_remaining:
+                delay = self._reset_at - time.monotonic()
+                if delay > 0:
+                    logger.info("reddit.ratelimit_wait", delay_s=round(delay, 2))
+                    await asyncio.sleep(delay)
+                # New window: trust the next response's headers again.
+                self._remaining = None
+            if self._remaining is not None:
+                self._remaining -= 1
+
+    def _update(self, headers: httpx.Headers) -> None:
+        remaining = headers.get(RATELIMIT_REMAINING_HEADER)
+        reset = headers.get(RATELIMIT_RESET_HEADER)
+        if remaining is None or reset is None:
+            return
+        try:
+            self._remaining = float(remaining)
+            self._reset_at = time.monotonic() + float(reset)
+        except ValueError:
+            return
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._reserve()
+        response = await self._transport.handle_async_request(request)
+        self._update(response.headers)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ResponseCacheTransport(httpx.AsyncBaseTransport):
+    """Serve repeated Reddit GETs from a local SQLite file during development.
+
+    Only successful GET responses are stored, keyed by full URL (query string
+    included); entries older than `ttl_seconds` are refetched. Cache hits never
+    reach the wrapped transport, so they cost no concurrency slot or rate-limit
+    budget.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, path: str | Path, ttl_seconds: int) -> None:
+        self._transport = transport
+        self._ttl_seconds = ttl_seconds
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, stored_at REAL NOT NULL, content_type TEXT, body BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _lookup(self, url: str) -> httpx.Response | None:
+        row = self._conn.execute(
+            "SELECT content_type, body FROM responses WHERE url = ? AND stored_at > ?",
+            (url, time.time() - self._ttl_seconds),
+        ).fetchone()
+        if row is None:
+            return None
+        content_type, body = row
+        headers = {"content-type": content_type} if content_type else {}
+        return httpx.Response(200, headers=headers, content=body)
+
+    def _store(self, url: str, response: httpx.Response) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (url, stored_at, content_type, body) VALUES (?, ?, ?, ?)",
+            (url, time.time(), response.headers.get("content-type"), response.content),
+        )
+        self._conn.commit()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+        url = str(request.url)
+        cached = self._lookup(url)
+        if cached is not None:
+            logger.debug("reddit.response_cache_hit", url=url)
+            return cached
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == 200:
+            await response.aread()
+            self._store(url, response)
+        return response
+
+    async def aclose(self) -> None:
+        self._conn.close()
+        await self._transport.aclose()
+
+
+__all__ = [
+    "ConcurrencyLimitedTransport",
+    "RateLimitedTransport",
+    "ResponseCacheTransport",
+    "keepalive_socket_options",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import time
 
 from services.synthesizer.models import PostPayload, EvidenceRequest
@@ -17,12 +18,13 @@ def select_posts(fetch_result: FetchResult, cfg: ContextBuilderConfig) -> list[P
     Ranks posts (by relevance_score then post_karma) and returns up to cfg.max_posts.
     Does not mutate posts or truncate fields; comments remain attached for downstream usage.
     """
-    ranked_posts: list[Post] = list(fetch_result.posts or [])
-
-    ranked_posts.sort(key=lambda post: post.post_karma or 0, reverse=True)
-    ranked_posts.sort(key=lambda post: post.relevance_score or 0.0, reverse=True)
-
-    return ranked_posts[: cfg.max_posts]
+    # nlargest keeps only max_posts candidates in a heap instead of sorting every
+    # post twice; ties keep their fetch order, matching a stable sort.
+    return heapq.nlargest(
+        cfg.max_posts,
+        fetch_result.posts or [],
+        key=lambda post: (post.relevance_score or 0.0, post.post_karma or 0),
+    )
 
 def build_comment_excerpts(comments: list[Comment], cfg: ContextBuilderConfig) -> list[str]:
     """
@@ -6,6 +6,7 @@ Usage:
         summarize_llm_context,
         summarize_evidence_result,
         build_stage_diagnostics,
+        build_all_summaries,
     )
 """
 
@@ -13,44 +14,42 @@ from __future__ import annotations
 
 from typing import Any
 
-from services.fetch.schemas import FetchResult
-from services.synthesizer.models import EvidenceRequest, EvidenceResult
+from services.fetch.schemas import FetchResult, Post
+from services.synthesizer.models import EvidenceRequest, EvidenceResult, PostPayload
+
+
+def _fetch_post_summary(post: Post) -> dict[str, Any]:
+    return {
+        "post_id": post.id,
+        "subreddit": post.subreddit,
+        "title": post.title,
+        "url": post.url,
+        "relevance_score": post.relevance_score,
+        "post_karma": post.post_karma,
+        "matched_keywords": list(post.matched_keywords or []),
+        "num_comments": len(post.comments or []),
+    }
+
+
+def _payload_summary(payload: PostPayload) -> dict[str, Any]:
+    return {
+        "post_id": payload.post_id,
+        "subreddit": payload.subreddit,
+        "title": payload.title,
+        "url": payload.url,
+        "relevance_score": payload.relevance_score,
+        "post_karma": payload.post_karma,
+        "matched_keywords": list(payload.matched_keywords or []),
+        "num_comments": payload.num_comments,
+    }
 
 
 def summarize_fetch_result(fetch_result: FetchResult) -> list[dict[str, Any]]:
-    summary: list[dict[str, Any]] = []
-    for post in fetch_result.posts:
-        summary.append(
-            {
-                "post_id": post.id,
-                "subreddit": post.subreddit,
-                "title": post.title,
-                "url": post.url,
-                "relevance_score": post.relevance_score,
-                "post_karma": post.post_karma,
-                "matched_keywords": list(post.matched_keywords or []),
-                "num_comments": len(post.comments or []),
-            }
-        )
-    return summary
+    return [_fetch_post_summary(post) for post in fetch_result.posts]
 
 
 def summarize_llm_context(request: EvidenceRequest) -> list[dict[str, Any]]:
-    summary: list[dict[str, Any]] = []
-    for payload in request.post_payloads:
-        summary.append(
-            {
-                "post_id": payload.post_id,
-                "subreddit": payload.subreddit,
-                "title": payload.title,
-                "url": payload.url,
-                "relevance_score": payload.relevance_score,
-                "post_karma": payload.post_karma,
-                "matched_keywords": list(payload.matched_keywords or []),
-                "num_comments": payload.num_comments,
-            }
-        )
-    return summary
+    return [_payload_summary(payload) for payload in request.post_payloads]
 
 
 def summarize_evidence_result(result: EvidenceResult) -> dict[str, Any]:
@@ -62,15 +61,49 @@ def summarize_evidence_result(result: EvidenceResult) -> dict[str, Any]:
     }
 
 
-def build_stage_diagnostics(
-    fetch_summary: list[dict[str, Any]],
-    context_summary: list[dict[str, Any]],
-    evidence_summary: dict[str, Any],
+def _diagnostics_from_ids(
+    fetch_candidate_post_ids: set[str],
+    llm_context_post_ids: set[str],
 ) -> dict[str, Any]:
-    fetch_candidate_post_ids = {item["post_id"] for item in fetch_summary}
-    llm_context_post_ids = {item["post_id"] for item in context_summary}
     return {
         "fetch_candidate_post_ids": sorted(fetch_candidate_post_ids),
         "llm_context_post_ids": sorted(llm_context_post_ids),
         "dropped_before_context_post_ids": sorted(fetch_candidate_post_ids - llm_context_post_ids),
     }
+
+
+def build_stage_diagnostics(
+    fetch_summary: list[dict[str, Any]],
+    context_summary: list[dict[str, Any]],
+    evidence_summary: dict[str, Any],
+) -> dict[str, Any]:
+    return _diagnostics_from_ids(
+        {item["post_id"] for item in fetch_summary},
+        {item["post_id"] for item in context_summary},
+    )
+
+
+def build_all_summaries(
+    fetch_result: FetchResult,
+    request: EvidenceRequest,
+    result: EvidenceResult,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, Any], dict[str, Any]]:
+    """Build fetch, context, evidence summaries and diagnostics in one pass per stage.
+
+    Post IDs are collected while each summary is built, so the diagnostics do not
+    re-walk the summary lists.
+    """
+    fetch_summary: list[dict[str, Any]] = []
+    fetch_candidate_post_ids: set[str] = set()
+    for post in fetch_result.posts:
+        fetch_summary.append(_fetch_post_summary(post))
+        fetch_candidate_post_ids.add(post.id)
+
+    context_summary: list[dict[str, Any]] = []
+    llm_context_post_ids: set[str] = set()
+    for payload in request.post_payloads:
+        context_summary.append(_payload_summary(payload))
+        llm_context_post_ids.add(payload.post_id)
+
+    diagnostics = _diagnostics_from_ids(fetch_candidate_post_ids, llm_context_post_ids)
+    return fetch_summary, context_summary, summarize_evidence_result(result), diagnostics
@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import pytest
 
-from agent.clients.openai_client import get_openai_client
+from agent.clients.openai_client import _build_openai_client, get_openai_client
 from common.exceptions import AuthError
 from config.settings import settings
 
 
+@pytest.fixture(autouse=True)
+def _clear_client_cache() -> None:
+    _build_openai_client.cache_clear()
+
+
 def test_get_openai_client_raises_without_keyring_credentials(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -57,3 +62,26 @@ def test_get_openai_client_uses_ssm_when_env_credentials_are_absent(
     client = get_openai_client()
 
     assert client == {"api_key": "ssm-openai-key"}
+
+
+def test_get_openai_client_reads_keyring_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated calls with unchanged settings reuse the first client."""
+    lookups: list[tuple[str, str]] = []
+
+    def _get_password(service: str, label: str) -> str:
+        lookups.append((service, label))
+        return "keyring-openai-key"
+
+    monkeypatch.setattr(settings, "OPENAI_USE_KEYCHAIN", True)
+    monkeypatch.setattr("agent.clients.openai_client.keyring.get_password", _get_password)
+    monkeypatch.setattr(
+        "agent.clients.openai_client.OpenAI",
+        lambda api_key: object(),
+    )
+
+    first = get_openai_client()
+
+    assert get_openai_client() is first
+    assert len(lookups) == 1
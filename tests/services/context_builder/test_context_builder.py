@@ -108,6 +108,20 @@ def test_select_posts_ranks_by_score() -> None:
     ]
 
 
+def test_select_posts_keeps_fetch_order_for_ties() -> None:
+    cfg = make_cfg(max_posts=3)
+    posts = [
+        make_post("first", relevance_score=0.5, post_karma=10),
+        make_post("best", relevance_score=0.9, post_karma=1),
+        make_post("second", relevance_score=0.5, post_karma=10),
+        make_post("third", relevance_score=0.5, post_karma=10),
+    ]
+
+    result = select_posts(make_fetch_result(posts), cfg)
+
+    assert [post.id for post in result] == ["best", "first", "second"]
+
+
 def test_build_comment_excerpts_limits_and_truncates() -> None:
     cfg = make_cfg(max_comments_per_post=2, max_comment_chars=5)
     comments = [
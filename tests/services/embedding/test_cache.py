@@ -4,9 +4,25 @@ Usage:
     pytest tests/services/embedding/test_cache.py
 """
 
+import gc
+import sqlite3
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from services.embedding.cache import get_embedding, init_cache, set_embedding
+from services.embedding.cache import (
+    _connect,
+    deserialize_vector,
+    get_embedding,
+    get_embedding_many,
+    init_cache,
+    serialize_vector,
+    set_embedding,
+    set_embedding_many,
+)
+from services.embedding.similarity import cosine_similarity
 
 
 def test_cache_round_trip(tmp_path) -> None:
@@ -25,3 +41,168 @@ def test_cache_round_trip(tmp_path) -> None:
     assert dims == len(vector)
     # Stored as float32, so allow minor rounding differences on round-trip.
     assert loaded_vector == pytest.approx(vector)
+
+
+def test_deserialize_returns_packed_float32_array() -> None:
+    vector = array("f", [0.5, -1.0])
+    blob = serialize_vector(vector)
+
+    loaded = deserialize_vector(blob, 2)
+
+    assert isinstance(loaded, array)
+    assert loaded.typecode == "f"
+    assert loaded == vector
+    assert deserialize_vector(blob, 3) is None
+
+
+def test_connection_reused_per_thread(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other_thread_connection = pool.submit(_connect, db_path).result()
+
+    assert _connect(db_path) is _connect(db_path)
+    assert other_thread_connection is not _connect(db_path)
+
+
+def test_reader_connection_closed_when_thread_exits(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+
+    worker_connections = []
+    worker = threading.Thread(target=lambda: worker_connections.append(_connect(db_path)))
+    worker.start()
+    worker.join()
+    del worker
+    gc.collect()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        worker_connections[0].execute("SELECT 1")
+
+
+def test_connection_uses_wal_with_normal_sync(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+
+    connection = _connect(db_path)
+
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    # 1 == NORMAL
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_set_embedding_many_round_trip(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+    model = "text-embedding-3-small"
+    rows = [("digest-1", model, 2, [0.1, 0.2]), ("digest-2", model, 2, [0.3, 0.4])]
+
+    set_embedding_many(db_path, rows)
+
+    for digest, _, dims, vector in rows:
+        result = get_embedding(db_path, digest, model)
+        assert result is not None
+        assert result[1] == dims
+        assert result[0] == pytest.approx(vector)
+
+
+def test_get_embedding_many_returns_only_hits(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+    model = "text-embedding-3-small"
+    set_embedding(db_path, "digest-1", model, 2, [0.1, 0.2])
+
+    found = get_embedding_many(db_path, ["digest-1", "missing", "digest-1"], model)
+
+    assert set(found) == {"digest-1"}
+    assert found["digest-1"][0] == pytest.approx([0.1, 0.2])
+    assert get_embedding_many(db_path, ["digest-1"], "other-model") == {}
+
+
+def test_init_cache_migrates_rowid_table(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    model = "text-embedding-3-small"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        "CREATE TABLE embeddings (content_digest TEXT NOT NULL, model TEXT NOT NULL, "
+        "dims INTEGER NOT NULL, embedding BLOB NOT NULL, PRIMARY KEY (content_digest, model))"
+    )
+    legacy.execute(
+        "INSERT INTO embeddings VALUES (?, ?, ?, ?)",
+        ("digest-1", model, 2, serialize_vector([0.1, 0.2])),
+    )
+    legacy.commit()
+    legacy.close()
+
+    init_cache(db_path)
+
+    schema = _connect(db_path).execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'embeddings'"
+    ).fetchone()[0]
+    assert "WITHOUT ROWID" in schema.upper()
+    result = get_embedding(db_path, "digest-1", model)
+    assert result is not None
+    assert result[0] == pytest.approx([0.1, 0.2])
+
+
+def test_serialize_vector_accepts_float32_buffers() -> None:
+    vector = array("f", [0.25, -0.5])
+    expected = vector.tobytes()
+
+    assert serialize_vector(vector) == expected
+    assert serialize_vector(memoryview(vector)) == expected
+    assert serialize_vector(bytearray(expected)) == expected
+    assert serialize_vector([0.25, -0.5]) == expected
+
+
+def test_reader_connection_is_query_only(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+
+    with pytest.raises(sqlite3.OperationalError):
+        _connect(db_path).execute(
+            "INSERT INTO embeddings VALUES (?, ?, ?, ?)", ("digest-1", "model", 1, b"\x00" * 4)
+        )
+
+    set_embedding(db_path, "digest-1", "model", 1, [1.0])
+    assert get_embedding(db_path, "digest-1", "model") is not None
+
+
+def test_scalar_quantization_round_trip(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    init_cache(db_path)
+    model = "text-embedding-3-small"
+    vector = [0.12, -0.5, 0.33, 0.0, 0.49]
+
+    set_embedding(db_path, "digest-q", model, len(vector), vector, quantization="scalar")
+    set_embedding(db_path, "digest-f", model, len(vector), vector)
+
+    quantized = get_embedding(db_path, "digest-q", model)
+    assert quantized is not None
+    assert quantized[1] == len(vector)
+    assert quantized[0] == pytest.approx(vector, abs=0.5 / 127)
+    assert cosine_similarity(quantized[0], vector) > 0.999
+    assert get_embedding_many(db_path, ["digest-q", "digest-f"], model).keys() == {"digest-q", "digest-f"}
+
+
+def test_init_cache_adds_dtype_column(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        "CREATE TABLE embeddings (content_digest TEXT NOT NULL, model TEXT NOT NULL, "
+        "dims INTEGER NOT NULL, embedding BLOB NOT NULL, "
+        "PRIMARY KEY (content_digest, model)) WITHOUT ROWID"
+    )
+    legacy.execute(
+        "INSERT INTO embeddings VALUES (?, ?, ?, ?)",
+        ("digest-1", "model", 2, serialize_vector([0.1, 0.2])),
+    )
+    legacy.commit()
+    legacy.close()
+
+    init_cache(db_path)
+
+    result = get_embedding(db_path, "digest-1", "model")
+    assert result is not None
+    assert result[0] == pytest.approx([0.1, 0.2])
@@ -7,7 +7,9 @@ Usage:
 from types import SimpleNamespace
 
 import pytest
+import structlog
 
+from config.logging_config import plan_context_scope
 from services.embedding.client import EmbeddingClient, content_digest, normalize_text
 from services.embedding.stores.sqlite_store import SQLiteVectorStore
 
@@ -168,3 +170,46 @@ def test_embed_texts_chunk_failure_isolates(tmp_path) -> None:
 
     assert results[0] is None
     assert results[1] is None
+
+
+def test_embed_texts_multiple_chunks_preserve_order(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    model = "text-embedding-3-small"
+    texts = [f"text {i}" for i in range(2100)]
+    api_calls = []
+
+    class DummyClient:
+        def __init__(self) -> None:
+            self.embeddings = SimpleNamespace(create=self._create)
+
+        def _create(self, *, model: str, input):
+            api_calls.append(len(input))
+            return _make_api_response([[float(text.split()[1]), 1.0] for text in input])
+
+    store = SQLiteVectorStore(db_path)
+    embedder = EmbeddingClient(client=DummyClient(), model=model, store=store)
+    results = embedder.embed_texts(texts)
+
+    assert sorted(api_calls) == [52, 2048]
+    assert [vector[0] for vector in results] == [float(i) for i in range(2100)]
+
+
+def test_embed_texts_chunk_threads_keep_plan_context(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    texts = [f"text {i}" for i in range(2100)]
+    seen_plan_ids = []
+
+    class DummyClient:
+        def __init__(self) -> None:
+            self.embeddings = SimpleNamespace(create=self._create)
+
+        def _create(self, *, model: str, input):
+            seen_plan_ids.append(structlog.contextvars.get_contextvars().get("plan_id"))
+            return _make_api_response([[1.0, 0.0] for _ in input])
+
+    store = SQLiteVectorStore(db_path)
+    embedder = EmbeddingClient(client=DummyClient(), model="text-embedding-3-small", store=store)
+    with plan_context_scope("abcdef1234567890"):
+        embedder.embed_texts(texts)
+
+    assert seen_plan_ids == ["abcdef12", "abcdef12"]
@@ -6,7 +6,7 @@ Usage:
 
 import pytest
 
-from services.embedding.similarity import cosine_similarity
+from services.embedding.similarity import cosine_similarity, cosine_similarity_batch
 
 
 def test_identical_vectors() -> None:
@@ -23,3 +23,18 @@ def test_zero_vector() -> None:
 
 def test_length_mismatch() -> None:
     assert cosine_similarity([1.0, 2.0], [1.0]) == 0.0
+
+
+def test_batch_matches_pairwise_and_handles_missing() -> None:
+    query = [1.0, 2.0, 3.0]
+    vectors = [[1.0, 2.0, 3.0], [3.0, 2.0, 1.0], None, [0.0, 0.0, 0.0], [1.0]]
+    scores = cosine_similarity_batch(query, vectors)
+    assert scores[:2] == pytest.approx([cosine_similarity(query, v) for v in vectors[:2]])
+    assert scores[2:] == [0.0, 0.0, 0.0]
+
+
+def test_same_object_short_circuits() -> None:
+    vector = [0.3, 0.4]
+    assert cosine_similarity(vector, vector) == 1.0
+    zero = [0.0, 0.0]
+    assert cosine_similarity(zero, zero) == 0.0
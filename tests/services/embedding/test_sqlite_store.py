@@ -0,0 +1,54 @@
+"""SQLite vector store tests.
+
+Usage:
+    pytest tests/services/embedding/test_sqlite_store.py
+"""
+
+import pytest
+
+from services.embedding.stores import sqlite_store
+from services.embedding.stores.sqlite_store import SQLiteVectorStore
+
+
+def test_repeat_lookup_served_from_memory(tmp_path, mocker) -> None:
+    store = SQLiteVectorStore(str(tmp_path / "embedding_cache.sqlite3"))
+    model = "text-embedding-3-small"
+    store.set_embedding("digest-1", model, 2, [0.1, 0.2])
+    store.clear_cache()
+
+    spy = mocker.spy(sqlite_store, "get_embedding")
+    first = store.get_embedding("digest-1", model)
+    second = store.get_embedding("digest-1", model)
+
+    assert spy.call_count == 1
+    assert second is first
+    assert first is not None
+    assert first[0] == pytest.approx([0.1, 0.2])
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path, mocker) -> None:
+    store = SQLiteVectorStore(str(tmp_path / "embedding_cache.sqlite3"), memory_cache_size=2)
+    model = "text-embedding-3-small"
+    store.set_embedding_many(
+        [("a", model, 1, [1.0]), ("b", model, 1, [2.0]), ("c", model, 1, [3.0])]
+    )
+
+    spy = mocker.spy(sqlite_store, "get_embedding_many")
+    found = store.get_embedding_many(["a", "b", "c"], model)
+
+    assert [found[key][0][0] for key in ("a", "b", "c")] == [1.0, 2.0, 3.0]
+    spy.assert_called_once_with(store._db_path, ["a"], model)
+
+
+def test_quantized_write_caches_vector_as_read_back(tmp_path) -> None:
+    db_path = str(tmp_path / "embedding_cache.sqlite3")
+    model = "text-embedding-3-small"
+    vector = [0.123, -0.987, 0.5]
+    warm = SQLiteVectorStore(db_path, quantization="scalar")
+    warm.set_embedding("digest-1", model, 3, vector)
+    warm.set_embedding_many([("digest-2", model, 3, vector)])
+
+    fresh = SQLiteVectorStore(db_path, quantization="scalar")
+
+    for digest in ("digest-1", "digest-2"):
+        assert list(warm.get_embedding(digest, model)[0]) == list(fresh.get_embedding(digest, model)[0])
@@ -0,0 +1,26 @@
+"""Vector store factory tests.
+
+Usage:
+    pytest tests/services/embedding/test_store_factory.py
+"""
+
+import pytest
+
+from config.settings import settings
+from services.embedding.store_factory import get_vector_store
+
+
+def test_get_vector_store_reuses_instance_per_path(tmp_path, mocker) -> None:
+    mocker.patch.object(settings, "VECTOR_STORE_TYPE", "sqlite")
+    mocker.patch.object(settings, "EMBEDDING_CACHE_PATH", str(tmp_path / "a.sqlite3"))
+    first = get_vector_store()
+    assert get_vector_store() is first
+
+    mocker.patch.object(settings, "EMBEDDING_CACHE_PATH", str(tmp_path / "b.sqlite3"))
+    assert get_vector_store() is not first
+
+
+def test_get_vector_store_rejects_unknown_type(mocker) -> None:
+    mocker.patch.object(settings, "VECTOR_STORE_TYPE", "unknown")
+    with pytest.raises(ValueError):
+        get_vector_store()
@@ -0,0 +1,42 @@
+"""Tests for comment filtering."""
+
+from __future__ import annotations
+
+from services.fetch.comment_pipeline import filter_comments
+from services.fetch.content_filters import MIN_COMMENT_LENGTH
+
+
+def _raw_comment(comment_id: str, body: str, score: int = 10) -> dict:
+    return {"id": comment_id, "body": body, "score": score, "author": "someone"}
+
+
+def test_short_raw_body_rejected_before_cleaning(mocker):
+    clean = mocker.patch("services.fetch.comment_pipeline.clean_text")
+
+    result = filter_comments("p1", [_raw_comment("c1", "too short")])
+
+    assert result == []
+    clean.assert_not_called()
+
+
+def test_filter_comments_keeps_long_comments_sorted_by_karma():
+    body = "x" * MIN_COMMENT_LENGTH
+    raw = [
+        _raw_comment("low", body, score=3),
+        _raw_comment("high", body, score=50),
+        _raw_comment("karma", body, score=1),
+        _raw_comment("gone", "[deleted]"),
+    ]
+
+    result = filter_comments("p1", raw)
+
+    assert [comment["comment_id"] for comment in result] == ["high", "low"]
+
+
+def test_filter_comments_caps_to_max_comments_keeping_first_of_ties():
+    body = "x" * MIN_COMMENT_LENGTH
+    raw = [_raw_comment(f"c{i}", body, score=score) for i, score in enumerate([5, 9, 5, 7, 5])]
+
+    result = filter_comments("p1", raw, max_comments=3)
+
+    assert [comment["comment_id"] for comment in result] == ["c1", "c3", "c0"]
@@ -0,0 +1,53 @@
+"""Tests for building Post/Comment models from raw Reddit payloads."""
+
+from __future__ import annotations
+
+import pytest
+
+from services.fetch.reddit_builders import (
+    build_post_model,
+    normalize_subreddit,
+    post_permalink,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("DIY", "diy"),
+        ("r/HomeImprovement", "homeimprovement"),
+        ("/r/woodworking", "woodworking"),
+        ("rust", "rust"),
+        ("r/roofing", "roofing"),
+    ],
+)
+def test_normalize_subreddit(raw, expected):
+    assert normalize_subreddit(raw) == expected
+
+
+def test_build_post_model_keeps_leading_r_in_subreddit_name():
+    post = build_post_model(
+        raw_post={"id": "abc", "subreddit": "Renovations", "score": 12.0},
+        cleaned_title="title",
+        cleaned_body="body",
+        relevance_score=1.0,
+        matched_keywords=[],
+        comments=[],
+        fetched_at=0.0,
+    )
+
+    assert post.subreddit == "renovations"
+    assert post.post_karma == 12
+
+
+@pytest.mark.parametrize(
+    ("raw_post", "expected"),
+    [
+        ({"permalink": "/r/diy/comments/abc/title/"}, "https://www.reddit.com/r/diy/comments/abc/title/"),
+        ({"permalink": "https://www.reddit.com/r/diy/comments/abc/"}, "https://www.reddit.com/r/diy/comments/abc/"),
+        ({"url": "https://i.redd.it/x.jpg"}, "https://i.redd.it/x.jpg"),
+        ({"id": "abc"}, "https://www.reddit.com/comments/abc"),
+    ],
+)
+def test_post_permalink(raw_post, expected):
+    assert post_permalink(raw_post) == expected
@@ -8,6 +8,7 @@ from uuid import uuid4
 from common.exceptions import ExternalTimeoutError
 from config.settings import settings
 from agent.planner.model import SearchPlan
+from services.fetch import reddit_fetcher
 from services.fetch.reddit_fetcher import run_reddit_fetcher
 from services.fetch.schemas import Post
 
@@ -148,6 +149,147 @@ async def test_post_skipped_when_too_short(mocker):
     inner.fetch_comments.assert_not_called()
 
 
+async def test_concurrent_terms_share_one_comment_fetch(mocker):
+    """Terms searched concurrently that find the same post await a single comment fetch."""
+    plan = _make_plan(search_terms=["drywall", "patch", "spackle"])
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    inner = mocker.AsyncMock()
+
+    async def _search_same_post(**kwargs):
+        yield _raw_post("shared")
+
+    inner.paginate_search = _search_same_post
+    inner.fetch_comments.return_value = [{"body": "helpful comment", "score": 10}]
+
+    _mock_reddit_client(mocker, client=inner)
+    mocker.patch("services.fetch.reddit_fetcher.passes_post_validation", return_value=True)
+    mocker.patch("services.fetch.reddit_fetcher.is_post_too_short", return_value=False)
+    mocker.patch("services.fetch.reddit_fetcher.filter_comments", return_value=[{"body": "helpful comment"}])
+    mocker.patch("services.fetch.reddit_fetcher.build_comment_models", return_value=[MagicMock()])
+    mocker.patch(
+        "services.fetch.reddit_fetcher._score_post_candidates",
+        side_effect=lambda candidates: [_make_post(c.raw_post["id"]) for c in candidates],
+    )
+
+    result = await run_reddit_fetcher(plan=plan, post_limit=5)
+
+    assert inner.fetch_comments.await_count == 1
+    assert [post.id for post in result.posts] == ["shared"]
+
+
+async def test_post_found_by_several_terms_is_cleaned_once(mocker):
+    """Validation and clean_text run once per post, however many terms return it."""
+    plan = _make_plan(search_terms=["drywall", "patch", "spackle"])
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    inner = mocker.AsyncMock()
+
+    async def _search_same_post(**kwargs):
+        yield _raw_post("shared")
+
+    inner.paginate_search = _search_same_post
+    inner.fetch_comments.return_value = [{"body": "helpful comment", "score": 10}]
+
+    _mock_reddit_client(mocker, client=inner)
+    validation = mocker.patch("services.fetch.reddit_fetcher.passes_post_validation", return_value=True)
+    mocker.patch("services.fetch.reddit_fetcher.is_post_too_short", return_value=False)
+    clean = mocker.patch("services.fetch.reddit_fetcher.clean_text", side_effect=lambda text: text)
+    mocker.patch("services.fetch.reddit_fetcher.filter_comments", return_value=[{"body": "helpful comment"}])
+    mocker.patch("services.fetch.reddit_fetcher.build_comment_models", return_value=[MagicMock()])
+    mocker.patch("services.fetch.reddit_fetcher._score_post_candidates", return_value=[_make_post("shared")])
+
+    await run_reddit_fetcher(plan=plan, post_limit=5)
+
+    validation.assert_called_once()
+    assert clean.call_count == 2  # title + body
+
+
+async def test_rejected_post_starts_no_comment_fetch(mocker):
+    """Only posts that pass validation get a shared comment fetch; failures yield no candidate."""
+    inner = mocker.AsyncMock()
+
+    async def _search_two_posts(**kwargs):
+        yield _raw_post("invalid")
+        yield _raw_post("no_comments")
+
+    inner.paginate_search = _search_two_posts
+    inner.fetch_comments.side_effect = ExternalTimeoutError("comments timed out")
+    mocker.patch(
+        "services.fetch.reddit_fetcher.passes_post_validation",
+        side_effect=lambda raw_post: raw_post["id"] != "invalid",
+    )
+    mocker.patch("services.fetch.reddit_fetcher.is_post_too_short", return_value=False)
+    comment_tasks: dict = {}
+
+    candidates = await reddit_fetcher._fetch_posts_for_pair(
+        subreddit="diy",
+        term="patch",
+        post_limit=5,
+        per_subreddit_limit=5,
+        fetched_at=0.0,
+        client=inner,
+        comment_tasks=comment_tasks,
+        cleaned_posts={},
+    )
+
+    assert candidates == []
+    assert list(comment_tasks) == ["no_comments"]
+    inner.fetch_comments.assert_awaited_once_with(post_id="no_comments")
+
+
+async def test_post_kept_when_another_term_finding_it_fails(mocker):
+    """A search failure after yielding a post must not hide it from other terms."""
+    plan = _make_plan(search_terms=["drywall", "patch"])
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    inner = mocker.AsyncMock()
+
+    async def _search(*, query, **kwargs):
+        yield _raw_post("shared")
+        if query == "drywall":
+            raise ExternalTimeoutError("search timed out")
+
+    inner.paginate_search = _search
+    inner.fetch_comments.return_value = [{"body": "helpful comment", "score": 10}]
+
+    _mock_reddit_client(mocker, client=inner)
+    mocker.patch("services.fetch.reddit_fetcher.passes_post_validation", return_value=True)
+    mocker.patch("services.fetch.reddit_fetcher.is_post_too_short", return_value=False)
+    mocker.patch("services.fetch.reddit_fetcher.filter_comments", return_value=[{"body": "helpful comment"}])
+    mocker.patch("services.fetch.reddit_fetcher.build_comment_models", return_value=[MagicMock()])
+    mocker.patch(
+        "services.fetch.reddit_fetcher._score_post_candidates",
+        side_effect=lambda candidates: [_make_post(c.raw_post["id"]) for c in candidates],
+    )
+
+    result = await run_reddit_fetcher(plan=plan, post_limit=5)
+
+    assert [post.id for post in result.posts] == ["shared"]
+
+
+async def test_short_raw_body_skips_cleaning(mocker):
+    """A selftext already under the minimum length is rejected before clean_text runs."""
+    plan = _make_plan()
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    inner = mocker.AsyncMock()
+
+    async def _search_short(**kwargs):
+        yield {"id": "short", "title": "Quick question", "selftext": "Too short to keep"}
+
+    inner.paginate_search = _search_short
+    _mock_reddit_client(mocker, client=inner)
+    mocker.patch("services.fetch.reddit_fetcher.passes_post_validation", return_value=True)
+    clean = mocker.patch("services.fetch.reddit_fetcher.clean_text")
+
+    result = await run_reddit_fetcher(plan=plan, post_limit=5)
+
+    assert result.posts == []
+    clean.assert_not_called()
+    inner.fetch_comments.assert_not_called()
+
+
 # --- Concurrent comment gather ---
 
 async def test_partial_comment_failure(mocker):
@@ -178,3 +320,107 @@ async def test_partial_comment_failure(mocker):
     result = await run_reddit_fetcher(plan=plan, post_limit=5)
 
     assert len(result.posts) == 1
+
+
+# --- Subreddit grouping ---
+
+async def test_subreddits_share_one_search_per_term(mocker):
+    """All plan subreddits are searched together via a combined r/a+b path."""
+    plan = _make_plan(subreddits=["diy", "homeimprovement", "fixit"], search_terms=["drywall", "patch"])
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    calls: list[dict] = []
+
+    async def _search_empty(**kwargs):
+        calls.append(kwargs)
+        return
+        yield
+
+    inner = mocker.AsyncMock()
+    inner.paginate_search = _search_empty
+    _mock_reddit_client(mocker, client=inner)
+
+    await run_reddit_fetcher(plan=plan, post_limit=5)
+
+    assert sorted(call["query"] for call in calls) == ["drywall", "patch"]
+    assert {call["subreddit"] for call in calls} == {"diy+homeimprovement+fixit"}
+    assert {call["limit"] for call in calls} == {15}
+
+
+async def test_duplicate_search_terms_are_searched_once(mocker):
+    """Terms differing only in case or spacing share one search request."""
+    plan = _make_plan(search_terms=["Drywall patch", "drywall  patch", "mud"])
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    calls: list[dict] = []
+
+    async def _search_empty(**kwargs):
+        calls.append(kwargs)
+        return
+        yield
+
+    inner = mocker.AsyncMock()
+    inner.paginate_search = _search_empty
+    _mock_reddit_client(mocker, client=inner)
+
+    result = await run_reddit_fetcher(plan=plan, post_limit=5)
+
+    assert sorted(call["query"] for call in calls) == ["Drywall patch", "mud"]
+    assert result.search_terms == plan.search_terms
+
+
+# --- CPU worker pool ---
+
+async def test_comment_filtering_in_worker_process_matches_inline(mocker):
+    """With FETCHER_CPU_WORKERS set, comments are filtered in a process pool with identical results."""
+    body = "Score the drywall paper first, then snap it along the line and cut the back. " * 3
+    raw_comments = [
+        {"id": "c1", "body": body, "score": 7, "author": "a"},
+        {"id": "c2", "body": "short", "score": 9, "author": "b"},
+    ]
+    inner = mocker.AsyncMock()
+    inner.fetch_comments.return_value = raw_comments
+
+    mocker.patch.object(settings, "FETCHER_CPU_WORKERS", 0)
+    inline = await reddit_fetcher._fetch_comment_models(client=inner, post_id="p1", fetched_at=1.0)
+
+    mocker.patch.object(settings, "FETCHER_CPU_WORKERS", 1)
+    mocker.patch.object(reddit_fetcher, "_cpu_pool", None)
+    try:
+        pooled = await reddit_fetcher._fetch_comment_models(client=inner, post_id="p1", fetched_at=1.0)
+    finally:
+        if reddit_fetcher._cpu_pool is not None:
+            reddit_fetcher._cpu_pool.shutdown()
+
+    assert [comment.comment_id for comment in inline] == ["c1"]
+    assert pooled == inline
+
+
+async def test_combined_search_caps_posts_per_subreddit(mocker):
+    """A busy subreddit in a combined listing cannot take more than its own post_limit."""
+    plan = _make_plan(subreddits=["homeimprovement", "woodworking"])
+    mocker.patch.object(settings, "USE_SEMANTIC_RANKING", False)
+
+    inner = mocker.AsyncMock()
+
+    async def _search_combined(**kwargs):
+        yield {**_raw_post("big1"), "subreddit": "HomeImprovement"}
+        yield {**_raw_post("big2"), "subreddit": "homeimprovement"}
+        yield {**_raw_post("niche1"), "subreddit": "woodworking"}
+
+    inner.paginate_search = _search_combined
+    inner.fetch_comments.return_value = [{"body": "helpful comment", "score": 10}]
+
+    _mock_reddit_client(mocker, client=inner)
+    mocker.patch("services.fetch.reddit_fetcher.passes_post_validation", return_value=True)
+    mocker.patch("services.fetch.reddit_fetcher.is_post_too_short", return_value=False)
+    mocker.patch("services.fetch.reddit_fetcher.filter_comments", return_value=[{"body": "helpful comment"}])
+    mocker.patch("services.fetch.reddit_fetcher.build_comment_models", return_value=[MagicMock()])
+    mocker.patch(
+        "services.fetch.reddit_fetcher._score_post_candidates",
+        side_effect=lambda candidates: [_make_post(c.raw_post["id"]) for c in candidates],
+    )
+
+    result = await run_reddit_fetcher(plan=plan, post_limit=1)
+
+    assert [post.id for post in result.posts] == ["big1", "niche1"]
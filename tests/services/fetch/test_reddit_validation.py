@@ -0,0 +1,39 @@
+"""Tests for raw Reddit payload validation helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from services.fetch.reddit_validation import is_deleted_or_removed, is_showcase_post
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (None, True),
+        ("", True),
+        ("   ", True),
+        ("[deleted]", True),
+        (" [Removed]\n", True),
+        ("[deleted] but I reposted the details below", False),
+        ("Sand with 120 grit, then 220.", False),
+    ],
+)
+def test_is_deleted_or_removed(text, expected):
+    assert is_deleted_or_removed(text) is expected
+
+
+def test_showcase_post_detected_from_title_or_body():
+    base = {"post_hint": "image", "score": 500}
+
+    assert is_showcase_post({**base, "title": "Just finished my deck", "selftext": ""})
+    assert is_showcase_post({**base, "title": "Deck", "selftext": "Before and after pics"})
+    assert not is_showcase_post({**base, "title": "Deck", "selftext": "How do I seal it?"})
+    assert not is_showcase_post({**base, "score": 10, "title": "Just finished my deck"})
+
+
+def test_showcase_phrase_covered_by_shorter_keyword_still_matches():
+    base = {"post_hint": "image", "score": 500, "selftext": ""}
+
+    assert is_showcase_post({**base, "title": "How I turned my garage into a shop"})
+    assert is_showcase_post({**base, "title": "How I figured out the wiring"})
@@ -0,0 +1,18 @@
+"""Tests for keyword relevance scoring."""
+
+from __future__ import annotations
+
+from services.fetch.scoring import evaluate_post_relevance
+
+
+def test_suffix_variants_match_on_word_boundaries():
+    _, positives, _, _ = evaluate_post_relevance("p1", "Installing a new faucet", "")
+    assert "install" in positives
+
+    _, positives, _, _ = evaluate_post_relevance("p2", "Prebuilt shelves", "")
+    assert "build" not in positives
+
+
+def test_multiword_keywords_match_exact_phrase():
+    _, positives, _, _ = evaluate_post_relevance("p1", "", "my mower won't start after winter")
+    assert "won't start" in positives
@@ -0,0 +1,38 @@
+"""Tests for Reddit text normalization."""
+
+from __future__ import annotations
+
+from services.fetch.utils import text_utils
+from services.fetch.utils.text_utils import clean_text
+
+
+def test_clean_text_strips_markdown_links_and_urls():
+    text = "**Sand** the [edge](https://example.com/x) first, see https://imgur.com/abc"
+    assert clean_text(text) == "Sand the edge first, see"
+
+
+def test_clean_text_collapses_whitespace_and_drops_non_ascii():
+    assert clean_text("Use  a\n\nputty knife — 6″ wide") == "Use a putty knife  6 wide"
+
+
+def test_clean_text_empty_input():
+    assert clean_text(None) == ""
+    assert clean_text("") == ""
+
+
+def test_clean_text_plain_prose_skips_markdown_render(mocker):
+    render = mocker.spy(text_utils._MARKDOWN, "render")
+
+    assert clean_text("Sanded it down,\nthen primed twice.  Still peeling?") == (
+        "Sanded it down, then primed twice. Still peeling?"
+    )
+    render.assert_not_called()
+
+
+def test_clean_text_line_start_markers_still_render():
+    assert clean_text("Steps:\n1. sand\n- prime") == "Steps: sand prime"
+
+
+def test_clean_text_drops_raw_script_and_survives_malformed_html():
+    assert clean_text("Before <script>alert(1)</script> after &amp; done") == "Before after & done"
+    assert clean_text("<div>\nbroken\n</div>\n&#<![<b>q</b>1]*") == "broken &# q 1]*"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
 
 from common.exceptions import AuthError
@@ -111,3 +114,55 @@ def test_reddit_session_from_env_uses_ssm_when_env_credentials_are_absent(
     assert session.client_id == "ssm-client-id"
     assert session.client_secret == "ssm-client-secret"
     assert session.user_agent == "ssm-user-agent"
+
+
+async def test_token_refresh_reuses_session_client() -> None:
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"access_token": "tok", "expires_in": 3600})
+
+    session = AsyncRedditSession(client_id="id", client_secret="secret", user_agent="ua")
+    await session.aclose()
+    session._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_handler),
+        headers={"User-Agent": session.user_agent},
+    )
+
+    client = await session.get_client()
+
+    assert client is session._client
+    assert client.headers["Authorization"] == "Bearer tok"
+    assert seen[0].headers["Authorization"].startswith("Basic ")
+    assert seen[0].headers["User-Agent"] == "ua"
+    await session.aclose()
+
+
+async def test_token_is_refreshed_in_background_before_expiry(mocker) -> None:
+    token_requests = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal token_requests
+        token_requests += 1
+        return httpx.Response(200, json={"access_token": f"tok{token_requests}", "expires_in": 3600})
+
+    session = AsyncRedditSession(client_id="id", client_secret="secret", user_agent="ua", token_refresh_buffer=60)
+    await session.aclose()
+    session._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+    yield_to_loop = asyncio.sleep
+    # First background wait returns immediately; the rescheduled one is cancelled.
+    background_sleep = mocker.patch(
+        "services.reddit_client.session.asyncio.sleep",
+        new=mocker.AsyncMock(side_effect=[None, asyncio.CancelledError()]),
+    )
+
+    client = await session.get_client()
+    for _ in range(5):
+        await yield_to_loop(0)
+
+    assert token_requests == 2
+    assert client.headers["Authorization"] == "Bearer tok2"
+    assert background_sleep.await_args_list[0].args[0] == pytest.approx(3600 - 120, abs=5)
+    await session.aclose()
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import aclosing
+
 import pytest
 import httpx
 
-from services.reddit_client.endpoints import fetch_comments, search_subreddit
+from services.reddit_client.endpoints import fetch_comments, paginate_search, search_subreddit
+
+# Captured before the autouse fixture patches asyncio.sleep.
+_yield_to_loop = asyncio.sleep
 
 
 @pytest.fixture(autouse=True)
@@ -72,3 +78,81 @@ async def test_connect_error_raises(mocker):
 
     with pytest.raises(httpx.ConnectError):
         await fetch_comments(client, post_id="t3_shelves321")
+
+
+async def test_fetch_comments_decodes_listing(mocker):
+    listing = [
+        {"data": {"children": [{"data": {"id": "post"}}]}},
+        {"data": {"children": [{"data": {"id": "c1", "body": "héllo"}}, {"data": {"id": "c2"}}]}},
+    ]
+    request = httpx.Request("GET", "https://oauth.reddit.com/comments/abc")
+    client = mocker.AsyncMock(spec=httpx.AsyncClient)
+    client.get.return_value = httpx.Response(200, json=listing, request=request)
+
+    comments = await fetch_comments(client, post_id="abc")
+
+    assert comments == [{"id": "c1", "body": "héllo"}, {"id": "c2"}]
+
+
+def _search_page(ids: list[str], after: str | None) -> httpx.Response:
+    request = httpx.Request("GET", "https://oauth.reddit.com/r/diy/search")
+    children = [{"data": {"id": post_id}} for post_id in ids]
+    return httpx.Response(200, json={"data": {"children": children, "after": after}}, request=request)
+
+
+async def test_paginate_search_requests_next_page_before_current_is_consumed(mocker):
+    pages = {None: _search_page(["a", "b"], "t3_b"), "t3_b": _search_page(["c"], None)}
+    client = mocker.AsyncMock(spec=httpx.AsyncClient)
+    client.get.side_effect = lambda url, params, timeout: pages[params.get("after")]
+
+    stream = paginate_search(client, subreddit="diy", query="caulk", limit=3)
+    first = await anext(stream)
+    await _yield_to_loop(0)  # let the prefetch task start
+
+    assert first == {"id": "a"}
+    assert client.get.call_count == 2
+    assert client.get.call_args.kwargs["params"]["after"] == "t3_b"
+    assert client.get.call_args.kwargs["params"]["limit"] == 1
+    assert [post async for post in stream] == [{"id": "b"}, {"id": "c"}]
+
+
+async def test_paginate_search_skips_prefetch_when_limit_reached(mocker):
+    client = mocker.AsyncMock(spec=httpx.AsyncClient)
+    client.get.return_value = _search_page(["a", "b"], "t3_b")
+
+    posts = [post async for post in paginate_search(client, subreddit="diy", query="caulk", limit=2)]
+
+    assert posts == [{"id": "a"}, {"id": "b"}]
+    assert client.get.call_count == 1
+
+
+async def test_paginate_search_aclose_cancels_pending_prefetch(mocker):
+    prefetch_cancelled = asyncio.Event()
+
+    async def _get(url, params, timeout):
+        if params.get("after") is None:
+            return _search_page(["a", "b"], "t3_b")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            prefetch_cancelled.set()
+            raise
+
+    client = mocker.AsyncMock(spec=httpx.AsyncClient)
+    client.get.side_effect = _get
+
+    async with aclosing(paginate_search(client, subreddit="diy", query="caulk", limit=5)) as stream:
+        await anext(stream)
+        await _yield_to_loop(0)  # let the prefetch task start
+    await _yield_to_loop(0)
+
+    assert prefetch_cancelled.is_set()
+
+
+async def test_paginate_search_requests_full_reddit_pages(mocker):
+    client = mocker.AsyncMock(spec=httpx.AsyncClient)
+    client.get.return_value = _search_page(["a"], None)
+
+    [post async for post in paginate_search(client, subreddit="diy+woodworking", query="caulk", limit=250)]
+
+    assert client.get.call_args.kwargs["params"]["limit"] == 100
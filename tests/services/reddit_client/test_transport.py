@@ -0,0 +1,113 @@
+"""Tests for Reddit httpx transport wrappers."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+
+import httpx
+import pytest
+
+from services.reddit_client.transport import (
+    ConcurrencyLimitedTransport,
+    RateLimitedTransport,
+    ResponseCacheTransport,
+    keepalive_socket_options,
+)
+
+
+async def test_concurrency_limited_transport_caps_in_flight_requests():
+    in_flight = 0
+    peak = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    transport = ConcurrencyLimitedTransport(httpx.MockTransport(_handler), max_concurrent_requests=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(*[client.get("https://oauth.reddit.com/x") for _ in range(6)])
+
+    assert [response.json() for response in responses] == [{"ok": True}] * 6
+    assert peak == 2
+
+
+def test_concurrency_limited_transport_rejects_zero_limit():
+    with pytest.raises(ValueError):
+        ConcurrencyLimitedTransport(httpx.MockTransport(lambda request: httpx.Response(200)), max_concurrent_requests=0)
+
+
+async def test_rate_limited_transport_waits_for_reset_when_budget_exhausted(mocker):
+    sleep = mocker.patch("services.reddit_client.transport.asyncio.sleep", new=mocker.AsyncMock())
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"X-Ratelimit-Remaining": "1.0", "X-Ratelimit-Reset": "30"})
+
+    async with httpx.AsyncClient(transport=RateLimitedTransport(httpx.MockTransport(_handler))) as client:
+        await client.get("https://oauth.reddit.com/x")
+        sleep.assert_not_awaited()
+        await client.get("https://oauth.reddit.com/x")
+
+    sleep.assert_awaited_once()
+    assert sleep.await_args.args[0] == pytest.approx(30, abs=1)
+
+
+async def test_rate_limited_transport_passes_through_with_budget_left(mocker):
+    sleep = mocker.patch("services.reddit_client.transport.asyncio.sleep", new=mocker.AsyncMock())
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"X-Ratelimit-Remaining": "3.0", "X-Ratelimit-Reset": "30"})
+
+    async with httpx.AsyncClient(transport=RateLimitedTransport(httpx.MockTransport(_handler))) as client:
+        for _ in range(3):
+            await client.get("https://oauth.reddit.com/x")
+
+    sleep.assert_not_awaited()
+
+
+async def test_response_cache_serves_repeat_gets_from_disk(tmp_path):
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"q": request.url.params["q"]})
+
+    cache_path = tmp_path / "reddit.sqlite"
+    for _ in range(2):
+        transport = ResponseCacheTransport(httpx.MockTransport(_handler), path=cache_path, ttl_seconds=60)
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await client.get("https://oauth.reddit.com/r/diy/search", params={"q": "drywall"})
+            other = await client.get("https://oauth.reddit.com/r/diy/search", params={"q": "grout"})
+
+    assert first.json() == {"q": "drywall"}
+    assert other.json() == {"q": "grout"}
+    assert len(calls) == 2
+
+
+async def test_response_cache_skips_errors_and_expired_entries(tmp_path):
+    statuses = iter([500, 200, 200])
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={})
+
+    transport = ResponseCacheTransport(httpx.MockTransport(_handler), path=tmp_path / "c.sqlite", ttl_seconds=0)
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert (await client.get("https://oauth.reddit.com/x")).status_code == 500
+        assert (await client.get("https://oauth.reddit.com/x")).status_code == 200
+        assert (await client.get("https://oauth.reddit.com/x")).status_code == 200
+
+    assert next(statuses, None) is None
+
+
+def test_keepalive_socket_options_enable_keepalive_and_skip_missing_knobs(monkeypatch):
+    monkeypatch.delattr(socket, "TCP_KEEPIDLE", raising=False)
+
+    options = keepalive_socket_options()
+
+    assert options[0] == (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    assert all(level == socket.IPPROTO_TCP for level, _, _ in options[1:])
+    assert len(options) == 1 + sum(hasattr(socket, name) for name in ("TCP_KEEPINTVL", "TCP_KEEPCNT"))
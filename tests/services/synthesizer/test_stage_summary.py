@@ -0,0 +1,77 @@
+"""Unit tests for stage-boundary summary helpers."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from services.fetch.schemas import FetchResult, Post
+from services.synthesizer.models import EvidenceRequest, EvidenceResult, PostPayload
+from services.synthesizer.stage_summary import (
+    build_all_summaries,
+    build_stage_diagnostics,
+    summarize_evidence_result,
+    summarize_fetch_result,
+    summarize_llm_context,
+)
+
+
+def _make_post(post_id: str) -> Post:
+    return Post(
+        id=post_id,
+        subreddit="diy",
+        title=f"title {post_id}",
+        selftext="body",
+        post_karma=10,
+        relevance_score=0.5,
+        matched_keywords=["drywall"],
+        url=f"https://reddit.com/{post_id}",
+        fetched_at=0.0,
+    )
+
+
+def _make_payload(post_id: str) -> PostPayload:
+    return PostPayload(
+        post_id=post_id,
+        subreddit="diy",
+        title=f"title {post_id}",
+        url=f"https://reddit.com/{post_id}",
+        body_excerpt="body",
+        post_karma=10,
+        num_comments=0,
+        relevance_score=0.5,
+        matched_keywords=["drywall"],
+    )
+
+
+def test_build_all_summaries_matches_individual_helpers() -> None:
+    plan_id = uuid4()
+    fetch_result = FetchResult(
+        query="patch drywall",
+        plan_id=plan_id,
+        search_terms=["drywall"],
+        subreddits=["diy"],
+        fetched_at=0.0,
+        posts=[_make_post("p2"), _make_post("p1"), _make_post("p3")],
+    )
+    request = EvidenceRequest(
+        query="patch drywall",
+        plan_id=plan_id,
+        post_payloads=[_make_payload("p1")],
+        prompt_version="v3",
+        max_posts=5,
+        max_comments_per_post=2,
+        max_post_chars=200,
+        max_comment_chars=100,
+        summary_char_budget=500,
+    )
+    result = EvidenceResult(status="ok", summary="s", limitations=[], prompt_version="v3")
+
+    fetch_summary, context_summary, evidence_summary, diagnostics = build_all_summaries(
+        fetch_result, request, result
+    )
+
+    assert fetch_summary == summarize_fetch_result(fetch_result)
+    assert context_summary == summarize_llm_context(request)
+    assert evidence_summary == summarize_evidence_result(result)
+    assert diagnostics == build_stage_diagnostics(fetch_summary, context_summary, evidence_summary)
+    assert diagnostics["dropped_before_context_post_ids"] == ["p2", "p3"]